@@ -1,6 +1,10 @@
 import os
 import sys
 import re
+import ast
+import bisect
+import fnmatch
+import stat
 import json
 import threading
 import queue
@@ -8,17 +12,23 @@ import subprocess
 import tempfile
 import time
 import modulefinder
+import pathlib
 import platform
+import io
+import locale
+import mmap
 import shutil
 import logging
 from subprocess import TimeoutExpired
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, QGroupBox,
                              QLabel, QLineEdit, QPushButton, QRadioButton, QCheckBox, QListWidget, QProgressBar,
                              QTextEdit, QMessageBox, QFileDialog, QInputDialog, QButtonGroup, QSlider,
                              QDialog, QFrame, QComboBox, QProgressDialog, QGridLayout)
 from PySide6.QtGui import QTextCursor, QIcon, QColor, QLinearGradient, QFont, QPainter, QPen
-from PySide6.QtCore import Qt, QTimer, QPoint, QThread, Signal, QMutex, QMutexLocker
+from PySide6.QtCore import (Qt, QTimer, QPoint, QThread, Signal, QMutex, QMutexLocker,
+                            QObject, QRunnable, QThreadPool)
 
 # 导入帮助内容模块
 from help_content import get_help_content
@@ -26,6 +36,10 @@ from help_content import get_help_content
 # 缓存相关导入
 import hashlib
 import pickle
+import zlib
+# 日志时间戳热路径用的模块级别名：省去每次调用的 模块+属性 两级字典查找
+from time import time as _time, strftime as _strftime, localtime as _localtime
+from collections import deque
 from datetime import datetime, timedelta
 
 # 配置日志系统
@@ -39,9 +53,64 @@ logging.basicConfig(
 
 # 常量定义
 CACHE_EXPIRY_DAYS = 7  # 缓存过期时间（天）
-MAX_WORKERS = min(4, os.cpu_count() or 4)  # 最大工作线程数
+CPU_COUNT = os.cpu_count() or 1  # CPU核心数（运行期间不变，导入时求值一次）
+MAX_WORKERS = min(4, CPU_COUNT)  # 最大工作线程数
 DEFAULT_TIMEOUT = 30  # 默认命令超时时间（秒）
 
+# 当前进程是否为打包后的exe（运行期间不变，导入时求值一次）
+IS_FROZEN = getattr(sys, 'frozen', False)
+
+# 打包环境下的备用Python解释器路径（PYTHON_PATH环境变量，导入时解析一次）
+FROZEN_PYTHON_PATH = os.environ.get('PYTHON_PATH', '') if IS_FROZEN else ''
+
+def get_fallback_python():
+    """返回未显式选择解释器时使用的默认Python路径
+
+    打包成exe后sys.executable指向exe本身，此时优先使用
+    PYTHON_PATH环境变量指定的解释器（导入时已缓存），否则退回'python'。
+
+    Returns:
+        str: Python解释器路径或命令
+    """
+    if IS_FROZEN:
+        # 当前是打包后的exe，尝试使用导入时解析的PYTHON_PATH
+        if FROZEN_PYTHON_PATH and os.path.exists(FROZEN_PYTHON_PATH):
+            return FROZEN_PYTHON_PATH
+        # 如果环境变量中没有Python路径或路径不存在，使用默认Python
+        return 'python'
+    # 当前是Python脚本，使用sys.executable
+    return sys.executable
+
+# 隐藏子进程命令行窗口的创建标志（Windows专用，比STARTUPINFO结构体更直接；其他平台为0）
+NO_WINDOW_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+def force_writable(func, path, exc_info):
+    """shutil.rmtree的onerror回调：去掉只读属性后重试删除
+
+    Windows上构建产物偶尔带只读属性（或被杀毒软件短暂置为只读），
+    直接删除会抛PermissionError；先改为可写再重试一次。
+    """
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+# Windows系统上UPX可能的安装路径（环境变量在进程启动后不变，导入时构建一次即可）
+UPX_POSSIBLE_PATHS = [
+    os.path.join(os.environ.get("ProgramFiles", ""), "upx", "upx.exe"),
+    os.path.join(os.environ.get("ProgramFiles(x86)", ""), "upx", "upx.exe"),
+    os.path.join(os.environ.get("USERPROFILE", ""), "AppData", "Local", "upx", "upx.exe"),
+    os.path.join(os.environ.get("USERPROFILE", ""), "Downloads", "upx", "upx.exe"),
+    "C:\\upx\\upx.exe",
+    "D:\\upx\\upx.exe"
+]
+
+# 批量添加模块时的分隔符正则（逗号/分号/换行，预编译一次）
+_MODULE_SPLIT_RE = re.compile(r'[,;\r\n]+')
+
+# 包列表解析正则（预编译，整段输出一次匹配，避免逐行Python循环）
+# 列分隔符用[ \t]而非\s，防止跨行吞并下一行；第三列起（如Editable项目路径）允许存在但不捕获
+_PIP_LIST_RE = re.compile(r'^(?!#|-|Package\b)(\S+)[ \t]+(\S+)(?:[ \t]+\S.*)?[ \t]*\r?$', re.M)
+_CONDA_LIST_RE = re.compile(r'^(?!#)(\S+)\s+(\S+)(?:\s+(\S+))?(?:\s+(\S+))?\s*$', re.M)
+
 class NeumorphicButton(QPushButton):
     """现代简洁风格按钮
     
@@ -49,24 +118,33 @@ class NeumorphicButton(QPushButton):
     具有统一的渐变背景、圆角边框和优雅的悬停效果。
     支持DPI自适应显示，提供一致的用户体验。
     """
+    # 屏幕DPI缩放比例缓存（进程内不变，所有按钮共享，只查询一次）
+    _screen_dpi_scale = None
+    # 按字号缓存的按钮字体（同一DPI下所有按钮复用同一个QFont）
+    _font_cache = {}
+
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         # 获取父窗口的DPI缩放比例，如果没有则使用默认值
         if parent and hasattr(parent, 'dpi_scale'):
             self.dpi_scale = parent.dpi_scale
         else:
-            # 如果没有父窗口或父窗口没有dpi_scale属性，使用默认缩放
-            screen = QApplication.primaryScreen()
-            self.dpi_scale = screen.logicalDotsPerInch() / 96.0
-        
+            # 如果没有父窗口或父窗口没有dpi_scale属性，使用屏幕缩放（类级缓存，只查询一次）
+            if NeumorphicButton._screen_dpi_scale is None:
+                screen = QApplication.primaryScreen()
+                NeumorphicButton._screen_dpi_scale = screen.logicalDotsPerInch() / 96.0
+            self.dpi_scale = NeumorphicButton._screen_dpi_scale
+
         self.setFixedHeight(self.get_scaled_size(36))  # 统一按钮高度
         self.setCursor(Qt.PointingHandCursor)  # 设置鼠标指针为手型
-        
-        # 设置按钮字体为微软雅黑加粗
-        font = self.font()
-        font.setFamily("Microsoft YaHei")
-        font.setPointSize(int(12 * self.dpi_scale))  # 统一字体大小
-        font.setBold(True)
+
+        # 设置按钮字体为微软雅黑加粗（按字号缓存，避免每个按钮重建QFont）
+        point_size = int(12 * self.dpi_scale)  # 统一字体大小
+        font = NeumorphicButton._font_cache.get(point_size)
+        if font is None:
+            font = QFont("Microsoft YaHei", point_size)
+            font.setBold(True)
+            NeumorphicButton._font_cache[point_size] = font
         self.setFont(font)
         
         # 应用统一样式
@@ -591,6 +669,24 @@ class ThreadManager:
         """获取活跃线程数量"""
         with QMutexLocker(self.thread_lock):
             return len([t for t in self.active_threads.values() if t.isRunning()])
+
+    def wait_for_all(self, timeout_ms=3000):
+        """等待所有活跃线程结束（内核级wait，代替轮询+sleep自旋）
+
+        Args:
+            timeout_ms (int): 总等待时间上限（毫秒）
+
+        Returns:
+            bool: 超时前是否全部结束
+        """
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        with QMutexLocker(self.thread_lock):
+            threads = [t for t in self.active_threads.values() if t.isRunning()]
+        for thread in threads:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0 or not thread.wait(remaining_ms):
+                return False
+        return True
     
     def get_thread(self, thread_id):
         """获取指定ID的线程
@@ -616,6 +712,41 @@ class ThreadManager:
                 thread.start()
 
 
+class SubprocessWorkerSignals(QObject):
+    """SubprocessWorker的信号载体
+
+    QRunnable本身不继承QObject，无法直接定义信号，
+    因此通过独立的QObject子类承载结果和错误信号。
+    """
+    result = Signal(object)
+    error = Signal(str)
+
+
+class SubprocessWorker(QRunnable):
+    """通用后台子进程执行器
+
+    将阻塞的subprocess调用封装为QRunnable放入QThreadPool执行，
+    执行完成后通过信号把结果送回GUI线程处理，
+    避免子进程运行期间阻塞Qt主事件循环导致界面卡顿。
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = SubprocessWorkerSignals()
+
+    def run(self):
+        """在线程池中执行阻塞函数并通过信号返回结果"""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.result.emit(result)
+
+
 class VersionCheckThread(QThread):
     """版本检测后台线程
     
@@ -671,11 +802,7 @@ class VersionCheckThread(QThread):
                 return self._cached_python_version
                 
             # Windows平台特殊处理，隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             # 执行python --version命令获取版本信息
             result = subprocess.run(
@@ -683,7 +810,7 @@ class VersionCheckThread(QThread):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                startupinfo=startupinfo,
+                creationflags=creationflags,
                 shell=False
             )
             
@@ -709,11 +836,7 @@ class VersionCheckThread(QThread):
                 return self._cached_nuitka_version
                 
             # Windows平台特殊处理，隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             # 执行python -m nuitka --version命令获取版本信息
             result = subprocess.run(
@@ -721,7 +844,7 @@ class VersionCheckThread(QThread):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                startupinfo=startupinfo,
+                creationflags=creationflags,
                 shell=False
             )
             
@@ -820,11 +943,7 @@ class NuitkaDetectionThread(QThread):
         
         try:
             # Windows平台特殊处理，隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             # 直接使用用户选择的Python解释器执行 nuitka --version
             self.log_message.emit(f"执行命令: {self.python_cmd} -m nuitka --version\n", "info")
@@ -833,7 +952,7 @@ class NuitkaDetectionThread(QThread):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                startupinfo=startupinfo,
+                creationflags=creationflags,
                 shell=False
             )
             self.log_message.emit(f"命令执行完成，返回码: {result.returncode}\n", "info")
@@ -869,7 +988,7 @@ class NuitkaDetectionThread(QThread):
                                     stdout=subprocess.PIPE,
                                     stderr=subprocess.PIPE,
                                     text=True,
-                                    startupinfo=startupinfo,
+                                    creationflags=creationflags,
                                     shell=False
                                 )
                                 if result.returncode == 0:
@@ -1020,36 +1139,28 @@ class DependencyScanThread(QThread):
                             raise FileNotFoundError(f"脚本文件不存在: {script_path}")
                         
                         try:
-                            with open(script_path, 'r', encoding='utf-8') as f:
+                            # 二进制整读+字节级正则：import语句按语法只含ASCII，
+                            # 免去整个文件的UTF-8解码，个别非法字节也不会中断扫描
+                            with open(script_path, 'rb') as f:
                                 content = f.read()
-                            
-                            # 使用正则表达式查找import语句
+
+                            # 使用正则表达式查找import语句（行首锚定，MULTILINE
+                            # 整体扫描代替逐行strip+match；注释行不会从行首匹配）
                             import re
-                            
+
                             # 匹配 import module
-                            import_pattern = r'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)'
+                            import_pattern = re.compile(
+                                rb'^\s*import\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)',
+                                re.MULTILINE)
                             # 匹配 from module import name
-                            from_pattern = r'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s+import'
-                            
-                            lines = content.split('\n')
-                            for line in lines:
-                                # 跳过注释行
-                                line = line.strip()
-                                if line.startswith('#'):
-                                    continue
-                                
-                                # 查找import语句
-                                match = re.match(import_pattern, line)
-                                if match:
-                                    module_name = match.group(1).split('.')[0]
-                                    self.imported_modules.add(module_name)
-                                    continue
-                                
-                                # 查找from...import语句
-                                match = re.match(from_pattern, line)
-                                if match:
-                                    module_name = match.group(1).split('.')[0]
-                                    self.imported_modules.add(module_name)
+                            from_pattern = re.compile(
+                                rb'^\s*from\s+([a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*)\s+import',
+                                re.MULTILINE)
+
+                            for match in import_pattern.finditer(content):
+                                self.imported_modules.add(match.group(1).split(b'.')[0].decode('ascii'))
+                            for match in from_pattern.finditer(content):
+                                self.imported_modules.add(match.group(1).split(b'.')[0].decode('ascii'))
                             
                             # 创建模拟的模块对象
                             for module_name in self.imported_modules:
@@ -2425,7 +2536,125 @@ class NuitkaPackager(QMainWindow):
     C_LINKING_PATTERN = re.compile(r'Nuitka-Scons: Backend C linking with (\d+) files')  # C链接模式
     COMPILATION_PATTERN = re.compile(r'Nuitka-Scons:.*compiling')  # 编译模式
     LINKING_PATTERN = re.compile(r'Nuitka-Scons:.*linking')      # 链接模式
-    
+    # 进度与所有阶段标记合并成一个正则：每行日志只扫描一次，
+    # 用lastgroup识别命中的标记，代替逐条子串查找加独立的进度search
+    STAGE_MARKER_RE = re.compile(
+        r'Progress:\s*(?P<progress_pct>\d+)%'
+        r'|(?P<dep_analysis>Analyzing dependencies|Dependency analysis)'
+        r'|(?P<c_linking>Nuitka-Scons: Backend C linking with \d+ files)'
+        r'|(?P<scons_compile>Nuitka-Scons:.*compiling)'
+        r'|(?P<final_linking>Nuitka-Scons:.*linking)'
+        r'|(?P<module_compile>Compiling)'
+        r'|(?P<code_gen>Generating C code|Code generation)'
+        r'|(?P<done>Done\.|Successfully created)'
+        r'|(?P<comp_unit>Compilation unit)'
+    )
+    # 阶段标记的廉价预筛字符集：每个标记都至少含其中一个大写字母，
+    # 不含任何一个的行（绝大多数编译器输出）可直接跳过正则扫描
+    STAGE_HOT_CHARS = frozenset('ACDGNS')
+
+    # 进度值到状态文本的分段查表：bisect定位区间代替九层if/elif，
+    # 含{p}占位符的条目才需要格式化
+    PROGRESS_STATUS_THRESHOLDS = (1, 5, 15, 40, 60, 75, 90, 98, 100)
+    PROGRESS_STATUS_TEXTS = (
+        "准备就绪",
+        "正在初始化...",
+        "🔍 正在分析项目依赖关系...",
+        "📦 正在编译模块 ({p:.0f}%)...",
+        "⚡ 正在生成C代码...",
+        "🔨 正在编译C代码 ({p:.0f}%)...",
+        "🔧 C链接处理中 ({p:.0f}%)...",
+        "🔗 最终链接中...",
+        "📋 正在完成打包...",
+        "✅ 打包完成",
+    )
+
+    # 界面选项到Nuitka命令行参数的查表（类常量，代替build_nuitka_command里的逐项分支）
+    OPT_LEVEL_ARGS = {
+        0: [],          # 无优化
+        1: ["-O"],      # 基本优化
+        2: ["-OO"],     # 完全优化
+    }
+    COMPILER_ARGS = {
+        "msvc": ["--msvc=latest"],  # Microsoft Visual C++编译器
+        "mingw": ["--mingw64"],     # MinGW-w64编译器
+    }
+    MODE_ARGS = {
+        "onefile": ["--onefile"],        # 单文件模式：将所有内容打包到一个可执行文件中
+        "standalone": ["--standalone"],  # 独立模式：生成包含所有依赖的文件夹
+    }
+    CONSOLE_ARGS = {
+        "enable": ["--windows-console-mode=force"],    # 强制显示控制台窗口（即使是GUI程序）
+        "disable": ["--windows-console-mode=disable"], # 完全禁用控制台，适用于纯GUI程序
+    }
+
+    # 构建产物清理规则：目录/文件名的fnmatch模式，预编译为正则后对scandir结果逐项匹配，
+    # 代替此前对同一目录反复调用glob.glob（每个模式都会重新列目录一次）
+    CLEANUP_DIR_PATTERNS = [
+        "*.build", "*.build-*", "build", "build-*",          # 标准构建文件夹
+        "*.dist", "*.dist-*",                                # dist文件夹
+        ".onefile-build", ".onefile-build-*",                # 单文件构建产物
+        "*.onefile-build", "*.onefile-build-*",
+    ]
+    CLEANUP_FILE_PATTERNS = [
+        "*.c", "*.cpp", "*.h", "*.o", "*.obj",               # 编译中间文件
+        "*.manifest", "*.lib", "*.exp",                      # 链接辅助文件
+    ]
+    # *.pdb调试符号只在一键清理的快速清扫中删除，
+    # 构建后的输出目录清理不扩大删除范围
+    QUICK_CLEANUP_FILE_PATTERNS = CLEANUP_FILE_PATTERNS + ["*.pdb"]
+    # 所有模式合并成一个正则，每个目录项只需一次match而不是逐模式尝试
+    CLEANUP_DIR_RE = re.compile(
+        "|".join(fnmatch.translate(p) for p in CLEANUP_DIR_PATTERNS), re.IGNORECASE)
+    CLEANUP_FILE_RE = re.compile(
+        "|".join(fnmatch.translate(p) for p in CLEANUP_FILE_PATTERNS), re.IGNORECASE)
+    QUICK_CLEANUP_FILE_RE = re.compile(
+        "|".join(fnmatch.translate(p) for p in QUICK_CLEANUP_FILE_PATTERNS), re.IGNORECASE)
+    # 文件规则都是"*.后缀"形式，先用endswith粗筛再跑正则；
+    # 目录规则命中的名字必然含有build或.dist子串
+    CLEANUP_FILE_SUFFIXES = tuple(p[1:] for p in QUICK_CLEANUP_FILE_PATTERNS)
+
+    # 对话框统一样式表（类常量，避免每次打开对话框都重建相同的样式字符串）
+    DIALOG_BASE_STYLESHEET = """
+        QDialog {
+            background-color: #E3F2FD;  /* 天蓝色背景 */
+            font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
+            color: #000000;  /* 黑色文字 */
+        }
+        QLabel {
+            color: #000000;  /* 黑色文字 */
+            font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
+        }
+        QPushButton {
+            background-color: #BBDEFB;
+            color: #000000;  /* 黑色文字 */
+            font-family: "SimHei";  /* 黑体字体 */
+            font-size: 16pt;
+            border: 1px solid #90CAF9;
+            border-radius: 5px;
+            padding: 8px 20px;
+            min-width: 80px;
+        }
+        QPushButton:hover {
+            background-color: #90CAF9;
+        }
+        QPushButton:pressed {
+            background-color: #64B5F6;
+        }
+    """
+
+    # 带文本输入框的对话框样式（在基础样式上追加QTextEdit部分）
+    DIALOG_TEXT_EDIT_STYLESHEET = DIALOG_BASE_STYLESHEET + """
+        QTextEdit {
+            background-color: #FFFFFF;  /* 白色文本框背景 */
+            color: #000000;  /* 黑色文字 */
+            font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
+            border: 1px solid #BBDEFB;
+            border-radius: 5px;
+            padding: 5px;
+        }
+    """
+
     def __init__(self):
         """初始化主窗口
         
@@ -2448,9 +2677,13 @@ class NuitkaPackager(QMainWindow):
         self.mode_var = "onefile"          # 打包模式：单文件模式
         self.platform_var = "windows"      # 目标平台：固定为Windows
         self.opt_var = 0                    # Python优化级别：默认级别0
-        self.jobs_var = min(4, os.cpu_count())  # 并行任务数：最多4个或CPU核心数
+        self.jobs_var = min(4, CPU_COUNT)  # 并行任务数：最多4个或CPU核心数
         self.upx_var = False                # UPX压缩：默认关闭
         self.upx_level = "best"            # UPX压缩级别：最佳压缩
+        self._upx_in_path_cache = None     # is_upx_in_path结果缓存：(结果, 检测时刻)，带TTL
+        self._script_imports_cache = {}    # 脚本顶层导入缓存：(路径, mtime, size) -> frozenset
+        self._script_imports_disk = None   # 跨会话的导入扫描结果缓存：sha256(内容) -> 模块名列表（首次用到时加载）
+        self._conda_list_cache = {}        # conda list输出缓存：环境名 -> (conda-meta哨兵mtime, 文本)
         self.lto_var = "yes"                # LTO优化：默认yes
         self.compiler_var = "mingw"        # 编译器：Windows默认使用MinGW
         self.plugins = []                  # 插件列表：初始为空
@@ -2467,6 +2700,7 @@ class NuitkaPackager(QMainWindow):
 
         # 配置文件路径
         self.config_path = os.path.join(self.temp_dir, "packager_config.json")
+        self._last_config_json = None  # 上次写入的配置内容，内容未变时跳过落盘
         
         # 日志文件管理（只在导出时创建）
         self.log_dir = os.path.join(os.getcwd(), "nuitka_logs")
@@ -2477,15 +2711,28 @@ class NuitkaPackager(QMainWindow):
         self.auto_scroll = True  # 默认自动滚动
         self.continuous_logging = True  # 启用连续日志记录
         self.user_action_logging = True  # 启用用户操作记录
-        self.log_buffer = []  # 日志缓冲区
         self.max_log_buffer_size = 1000  # 最大缓冲区大小
+        self.log_buffer = deque(maxlen=self.max_log_buffer_size)  # 日志缓冲区（满时自动淘汰最旧条目）
+        self._ts_cached_sec = -1  # 时间戳缓存：整秒值
+        self._ts_cached_str = ""  # 时间戳缓存：对应的strftime结果
+        self._last_progress_val = -1   # 进度条上次设置的值（跳过重复重绘）
+        self._last_progress_fmt = None  # 进度条上次设置的格式文本
+        # 日志标签对应的颜色只构造一次，免去每条日志解析一次颜色字符串
+        self._tag_colors = {
+            "error": QColor("#FF6B6B"),    # 红色
+            "success": QColor("#36C5F0"),  # 蓝色
+            "warning": QColor("#FFBA49"),  # 橙色
+            "info": QColor("#34A853"),     # 绿色
+        }
+        self._default_log_color = QColor("#4C5270")  # 深蓝色
+        self._pending_ui_log_chunks = []  # 窗口不可见期间积压的界面日志（文本, 标签）
         self.log_update_timer = QTimer(self)  # 日志更新定时器
         self.log_update_timer.timeout.connect(self.update_continuous_log)
         self.log_update_timer.start(500)  # 每500毫秒更新一次连续日志
         
         # 用户操作记录
-        self.user_actions = []  # 用户操作列表
         self.max_user_actions = 100  # 最大用户操作记录数
+        self.user_actions = deque(maxlen=self.max_user_actions)  # 用户操作列表（满时自动淘汰最旧记录）
         
         # 创建UI组件
         self.create_widgets()
@@ -2880,11 +3127,7 @@ class NuitkaPackager(QMainWindow):
                 return self._cached_python_versions[python_cmd]
                 
             # Windows平台特殊处理，隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             # 执行python --version命令获取版本信息
             result = subprocess.run(
@@ -2892,7 +3135,7 @@ class NuitkaPackager(QMainWindow):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                startupinfo=startupinfo,
+                creationflags=creationflags,
                 shell=False
             )
             
@@ -2922,11 +3165,7 @@ class NuitkaPackager(QMainWindow):
                 return self._cached_nuitka_versions[python_cmd]
                 
             # Windows平台特殊处理，隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             # 执行python -m nuitka --version命令获取版本信息
             result = subprocess.run(
@@ -2934,7 +3173,7 @@ class NuitkaPackager(QMainWindow):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
-                startupinfo=startupinfo,
+                creationflags=creationflags,
                 shell=False
             )
             
@@ -3198,6 +3437,10 @@ class NuitkaPackager(QMainWindow):
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        # 只追加不编辑：关闭撤销栈避免每次插入都累积undo记录，
+        # 行数上限交给Qt原生的maximumBlockCount淘汰（O(1)）
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.document().setMaximumBlockCount(500000)
         self.log_text.setFont(self.get_scaled_font(12))
         self.log_text.setMinimumHeight(self.get_scaled_size(350))  # 设置最小高度
         
@@ -3327,7 +3570,15 @@ class NuitkaPackager(QMainWindow):
         self.apply_combo_style(self.python_combo)
         self.python_combo.setPlaceholderText("选择或输入Python解释器路径 (可选)")
         self.python_combo.setFixedHeight(self.get_scaled_size(32))  # 减小高度
-        self.python_combo.currentTextChanged.connect(self.on_python_combo_changed)
+        # 防抖：键入/粘贴路径时currentTextChanged逐字符触发，
+        # 连发只在静默250毫秒后执行一次真正的版本检测
+        self._python_combo_debounce = QTimer(self)
+        self._python_combo_debounce.setSingleShot(True)
+        self._python_combo_debounce.setInterval(250)
+        self._python_combo_debounce.timeout.connect(
+            lambda: self.on_python_combo_changed(self.python_combo.currentText()))
+        self.python_combo.currentTextChanged.connect(
+            lambda _text: self._python_combo_debounce.start())
         
         # 按钮布局 - 减少按钮数量和尺寸
         python_btn_layout = QHBoxLayout()
@@ -3400,7 +3651,13 @@ class NuitkaPackager(QMainWindow):
         script_layout.addWidget(script_label)
         self.script_entry = QLineEdit()  # 脚本路径输入框
         self.script_entry.setFixedHeight(self.get_scaled_size(32))  # 减小高度
-        self.script_entry.textChanged.connect(self.on_script_path_changed)  # 连接文本变化信号
+        # 防抖：textChanged每个键击都触发，静默250毫秒后才做路径同步和预热
+        self._script_path_debounce = QTimer(self)
+        self._script_path_debounce.setSingleShot(True)
+        self._script_path_debounce.setInterval(250)
+        self._script_path_debounce.timeout.connect(self.on_script_path_changed)
+        self.script_entry.textChanged.connect(
+            lambda _text: self._script_path_debounce.start())
         script_layout.addWidget(self.script_entry, 1)  # 占据1份空间
         script_browse = NeumorphicButton("浏览")
         script_browse.setFixedWidth(self.get_scaled_size(70))  # 减小按钮宽度
@@ -4255,14 +4512,14 @@ class NuitkaPackager(QMainWindow):
         jobs_layout.setContentsMargins(self.get_scaled_size(5), self.get_scaled_size(5), self.get_scaled_size(5), self.get_scaled_size(5))  # 减小内边距
         
         # 显示当前任务数和CPU核心数
-        self.jobs_label = QLabel(f"任务数: {self.jobs_var} / {os.cpu_count()}")
+        self.jobs_label = QLabel(f"任务数: {self.jobs_var} / {CPU_COUNT}")
         self.jobs_label.setStyleSheet("color: #333333; font-size: 10pt;")
         jobs_layout.addWidget(self.jobs_label)
         
         # 并行任务数滑块控件
         self.jobs_slider = QSlider(Qt.Horizontal)
         self.jobs_slider.setMinimum(1)  # 最小1个任务
-        self.jobs_slider.setMaximum(os.cpu_count())  # 最大不超过CPU核心数
+        self.jobs_slider.setMaximum(CPU_COUNT)  # 最大不超过CPU核心数
         self.jobs_slider.setValue(self.jobs_var)  # 设置当前值
         self.jobs_slider.setFixedHeight(self.get_scaled_size(20))  # 统一高度
         self.jobs_slider.valueChanged.connect(self.update_jobs)  # 连接任务数更新功能
@@ -6590,117 +6847,136 @@ class NuitkaPackager(QMainWindow):
     def show_help(self):
         """显示帮助对话框
         
-        该方法创建并显示一个帮助对话框，包含Nuitka EXE打包工具的详细使用说明。
+        该方法显示一个帮助对话框，包含Nuitka EXE打包工具的详细使用说明。
         帮助内容涵盖了工具的主要功能、使用指南、操作流程、常见问题和注意事项。
+        对话框在首次调用时构建一次并缓存，之后直接复用，
+        避免每次打开帮助都重新解析帮助HTML和重建控件。
         """
-        # 创建帮助对话框
-        help_dialog = QDialog(self)
-        help_dialog.setWindowTitle("使用帮助")
-        help_dialog.setFixedSize(800, 800)
-        
-        # 设置对话框布局
-        layout = QVBoxLayout(help_dialog)
-        
-        # 创建文本编辑器用于显示帮助内容
-        text = QTextEdit()
-        text.setReadOnly(True)
-        text.setStyleSheet("background-color: #FFFFFF; color: #4C5270;")
-        
-        # 从外部模块获取帮助内容
-        help_content = get_help_content()
+        # 首次调用时构建帮助对话框并缓存
+        if getattr(self, '_help_dialog', None) is None:
+            help_dialog = QDialog(self)
+            help_dialog.setWindowTitle("使用帮助")
+            help_dialog.setFixedSize(800, 800)
 
-        
-        # 设置帮助内容并添加到布局
-        text.setHtml(help_content)
-        layout.addWidget(text)
-        
-        # 创建关闭按钮
-        close_btn = NeumorphicButton("关闭")
-        close_btn.setFixedHeight(self.get_scaled_size(28))   # 与主界面按钮高度一致
-        close_btn.setFixedWidth(self.get_scaled_size(80))    # 与主界面按钮宽度一致
-        close_btn.clicked.connect(help_dialog.accept)
-        layout.addWidget(close_btn, 0, Qt.AlignRight)
-        
-        # 显示帮助对话框
-        help_dialog.exec()
+            # 设置对话框布局
+            layout = QVBoxLayout(help_dialog)
+
+            # 创建文本编辑器用于显示帮助内容
+            text = QTextEdit()
+            text.setReadOnly(True)
+            text.setStyleSheet("background-color: #FFFFFF; color: #4C5270;")
+
+            # 从外部模块获取帮助内容
+            help_content = get_help_content()
+
+            # 设置帮助内容并添加到布局
+            text.setHtml(help_content)
+            layout.addWidget(text)
+
+            # 创建关闭按钮
+            close_btn = NeumorphicButton("关闭")
+            close_btn.setFixedHeight(self.get_scaled_size(28))   # 与主界面按钮高度一致
+            close_btn.setFixedWidth(self.get_scaled_size(80))    # 与主界面按钮宽度一致
+            close_btn.clicked.connect(help_dialog.accept)
+            layout.addWidget(close_btn, 0, Qt.AlignRight)
+
+            self._help_dialog = help_dialog
+
+        # 显示（复用）帮助对话框
+        self._help_dialog.exec()
     
     # ================= UPX 检测 =================
     
     def detect_upx(self):
         """检测UPX是否可用并自动设置
         该方法尝试检测系统中是否安装了UPX工具，并自动设置UPX路径。
-        如果检测到UPX，会自动填充路径到相应的输入框中。
+        检测过程在后台线程池中执行，避免阻塞主界面；
+        如果检测到UPX，检测结果回到主线程后自动填充路径到相应的输入框中。
         """
         # 记录用户操作
         self.log_user_action("UPX检测", "开始检测UPX工具")
-        
+
+        # 把阻塞的subprocess探测放入线程池执行，结果通过信号回到主线程
+        worker = SubprocessWorker(self._probe_upx)
+        worker.signals.result.connect(self._on_upx_probe_result)
+        worker.signals.error.connect(self._on_upx_probe_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _probe_upx(self):
+        """在后台线程中探测UPX是否安装（只做阻塞调用，不触碰界面）
+
+        Returns:
+            tuple: (是否检测到UPX, UPX路径或None)
+        """
+        # 在Windows系统上，设置创建标志以隐藏命令行窗口
+        creationflags = NO_WINDOW_FLAGS
+
         try:
-            # 尝试查找UPX路径
-            # 在Windows系统上，设置启动信息以隐藏命令行窗口
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
-            
             # 尝试直接运行upx命令来检测是否安装
-            result = subprocess.run(["upx", "--version"], 
-                                   stdout=subprocess.PIPE, 
+            result = subprocess.run(["upx", "--version"],
+                                   stdout=subprocess.PIPE,
                                    stderr=subprocess.PIPE,
                                    text=True,
                                    encoding='utf-8',
                                    errors='replace',
-                                   startupinfo=startupinfo)
-            
-            # 如果命令执行成功（返回码为0），表示UPX已安装
-            if result.returncode == 0:
-                # 提取UPX路径
-                upx_path = self.find_upx_path()
-                if upx_path:
-                    # 设置UPX路径到输入框
-                    if hasattr(self, 'upx_path_entry') and self.upx_path_entry is not None:
-                        self.upx_path_entry.setText(upx_path)
-                    # 记录成功日志
-                    self.log_message(f"✓ 已自动检测到UPX: {upx_path}\n", "success")
-                    # 记录用户操作
+                                   creationflags=creationflags)
+        except FileNotFoundError:
+            # 未安装UPX
+            return False, None
+
+        if result.returncode != 0:
+            return False, None
+
+        # 命令执行成功，进一步确定UPX的完整路径
+        return True, self.find_upx_path()
+
+    def _on_upx_probe_result(self, probe):
+        """UPX探测完成后在主线程中更新界面
+
+        Args:
+            probe (tuple): (是否检测到UPX, UPX路径或None)
+        """
+        found, upx_path = probe
+        if found:
+            if upx_path:
+                # 设置UPX路径到输入框
+                if hasattr(self, 'upx_path_entry') and self.upx_path_entry is not None:
+                    self.upx_path_entry.setText(upx_path)
+                # 记录成功日志
+                self.log_message(f"✓ 已自动检测到UPX: {upx_path}\n", "success")
+                # 记录用户操作
+                if self.user_action_logging:
                     self.log_user_action("UPX检测", f"检测成功: {upx_path}")
-                    
-                    # 自动将UPX路径添加到系统PATH环境变量中
-                    upx_dir = os.path.dirname(upx_path)
-                    current_path = os.environ.get('PATH', '')
-                    if upx_dir not in current_path:
-                        new_path = f"{upx_dir};{current_path}"
-                        os.environ['PATH'] = new_path
-                        self.log_message(f"✓ 已将UPX路径添加到环境变量PATH中: {upx_dir}\n", "success")
-                        # 记录用户操作
-                        self.log_user_action("UPX检测", f"已添加到PATH: {upx_dir}")
-                    
-                    return True
-                else:
-                    # 记录警告日志：检测到UPX但无法确定路径
-                    self.log_message("⚠ 检测到UPX但无法确定路径\n", "warning")
+
+                # 自动将UPX路径添加到系统PATH环境变量中
+                upx_dir = os.path.dirname(upx_path)
+                current_path = os.environ.get('PATH', '')
+                if upx_dir not in current_path:
+                    new_path = f"{upx_dir};{current_path}"
+                    os.environ['PATH'] = new_path
+                    # PATH已变化，失效UPX检测缓存
+                    self._upx_in_path_cache = None
+                    self.log_message(f"✓ 已将UPX路径添加到环境变量PATH中: {upx_dir}\n", "success")
                     # 记录用户操作
-                    self.log_user_action("UPX检测", "检测到UPX但无法确定路径")
-                    return False
+                    if self.user_action_logging:
+                        self.log_user_action("UPX检测", f"已添加到PATH: {upx_dir}")
             else:
-                # 记录警告日志：未检测到UPX
-                self.log_message("⚠ 未检测到UPX，请手动设置路径\n", "warning")
+                # 记录警告日志：检测到UPX但无法确定路径
+                self.log_message("⚠ 检测到UPX但无法确定路径\n", "warning")
                 # 记录用户操作
-                self.log_user_action("UPX检测", "未检测到UPX")
-                return False
-                
-        except FileNotFoundError:
-            # 捕获文件未找到异常，记录警告日志
+                self.log_user_action("UPX检测", "检测到UPX但无法确定路径")
+        else:
+            # 记录警告日志：未检测到UPX
             self.log_message("⚠ 未检测到UPX，请手动设置路径\n", "warning")
             # 记录用户操作
-            self.log_user_action("UPX检测", "文件未找到异常")
-            return False
-        except Exception as e:
-            # 捕获其他异常，记录错误日志
-            self.log_message(f"⚠ UPX检测错误: {str(e)}\n", "warning")
-            # 记录用户操作
-            self.log_user_action("UPX检测", f"检测异常: {str(e)}")
-            return False
+            self.log_user_action("UPX检测", "未检测到UPX")
+
+    def _on_upx_probe_error(self, error_msg):
+        """UPX探测过程中出现异常时在主线程中记录日志"""
+        self.log_message(f"⚠ UPX检测错误: {error_msg}\n", "warning")
+        # 记录用户操作
+        if self.user_action_logging:
+            self.log_user_action("UPX检测", f"检测异常: {error_msg}")
     
     def find_upx_path(self):
         """尝试查找UPX可执行文件路径
@@ -6712,37 +6988,13 @@ class NuitkaPackager(QMainWindow):
         Returns:
             str or None: UPX可执行文件的完整路径，如果未找到则返回None
         """
-        # 定义Windows系统上UPX可能的安装路径
-        possible_paths = [
-            os.path.join(os.environ.get("ProgramFiles", ""), "upx", "upx.exe"),
-            os.path.join(os.environ.get("ProgramFiles(x86)", ""), "upx", "upx.exe"),
-            os.path.join(os.environ.get("USERPROFILE", ""), "AppData", "Local", "upx", "upx.exe"),
-            os.path.join(os.environ.get("USERPROFILE", ""), "Downloads", "upx", "upx.exe"),
-            "C:\\upx\\upx.exe",
-            "D:\\upx\\upx.exe"
-        ]
-        
-        # 遍历可能的路径，检查文件是否存在
-        for path in possible_paths:
+        # 遍历模块级预构建的常见安装路径，检查文件是否存在
+        for path in UPX_POSSIBLE_PATHS:
             if os.path.exists(path):
                 return path
         
-        # 尝试通过where命令查找
-        try:
-            # Windows系统使用where命令
-            cmd = "where upx"
-            # 执行命令查找UPX路径
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, 
-                                  encoding='utf-8', errors='replace')
-            # 如果命令执行成功，返回找到的路径
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except:
-            # 忽略查找过程中可能出现的异常
-            pass
-        
-        # 如果未找到UPX路径，返回None
-        return None
+        # 在PATH中查找，shutil.which在进程内完成，免去启动where子进程的开销
+        return shutil.which("upx")
     
     # ================= Python包查询方法 =================
     
@@ -6759,83 +7011,115 @@ class NuitkaPackager(QMainWindow):
             return
             
         # 记录用户操作
-        self.log_user_action("Python包查询", f"开始查询包信息，使用解释器: {python_cmd}")
+        if self.user_action_logging:
+            self.log_user_action("Python包查询", f"开始查询包信息，使用解释器: {python_cmd}")
         
         self.log_message("🔍 开始查询Python环境中的原装包...\n", "info")
         self.log_message(f"📋 使用Python解释器: {python_cmd}\n", "info")
-        
-        try:
-            # 检查是否为conda环境
-            conda_env_name = self._get_conda_env_name(python_cmd)
-            
-            if conda_env_name:
-                # 如果是conda环境，使用conda list命令
-                self.log_message(f"🐍 检测到conda环境: {conda_env_name}\n", "info")
-                self.log_message("📋 使用mamba list查询包信息...\n", "info")
-                # 记录用户操作
+
+        # 检查是否为conda环境
+        conda_env_name = self._get_conda_env_name(python_cmd)
+
+        if conda_env_name:
+            # 如果是conda环境，使用conda list命令
+            self.log_message(f"🐍 检测到conda环境: {conda_env_name}\n", "info")
+            self.log_message("📋 使用mamba list查询包信息...\n", "info")
+            # 记录用户操作
+            if self.user_action_logging:
                 self.log_user_action("Python包查询", f"检测到conda环境: {conda_env_name}")
-                
-                # 构建mamba list命令
-                if sys.platform == "win32":
-                    # Windows系统下需要先激活conda环境
-                    cmd = f'conda activate {conda_env_name} && mamba list'
-                else:
-                    # Linux/macOS系统
-                    cmd = f'conda activate {conda_env_name} && mamba list'
-                
-                self.log_message(f"执行命令: {cmd}\n", "debug")
-                
-                # 执行命令，使用更健壮的编码处理
+
+            # 阻塞的mamba list调用放入线程池执行，结果通过信号回到主线程
+            worker = SubprocessWorker(self._run_mamba_list, conda_env_name)
+            worker.signals.result.connect(
+                lambda result, cmd=python_cmd: self._on_mamba_list_result(result, cmd))
+            worker.signals.error.connect(self._on_package_query_error)
+            QThreadPool.globalInstance().start(worker)
+        else:
+            # 非conda环境，使用pip list命令
+            self.log_message("📋 使用pip list查询包信息...\n", "info")
+            # 记录用户操作
+            self.log_user_action("Python包查询", "使用pip list查询包信息")
+            self._query_packages_with_pip(python_cmd)
+
+    def _run_mamba_list(self, conda_env_name):
+        """在后台线程中执行mamba list命令（只做阻塞调用，不触碰界面）
+
+        Args:
+            conda_env_name (str): conda环境名称
+
+        Returns:
+            subprocess.CompletedProcess: 命令执行结果
+        """
+        # 直接用-n指定环境并输出JSON，省掉conda activate的shell启动和文本表格解析
+        cmd = ['mamba', 'list', '-n', conda_env_name, '--json']
+
+        self.message_queue.put(("log", f"执行命令: {' '.join(cmd)}\n", "debug"))
+
+        # 在Windows系统上，设置创建标志以隐藏命令行窗口
+        creationflags = NO_WINDOW_FLAGS
+
+        result = subprocess.run(cmd, capture_output=True, text=True,
+                              encoding='utf-8', errors='replace',
+                              creationflags=creationflags)
+
+        return result
+
+    def _on_mamba_list_result(self, result, python_cmd):
+        """mamba list执行完成后在主线程中解析并显示结果
+
+        Args:
+            result (subprocess.CompletedProcess): 命令执行结果
+            python_cmd (str): Python解释器路径，用于pip备选方案
+        """
+        self.log_message(f"返回码: {result.returncode}\n", "debug")
+        self.log_message(f"标准输出长度: {len(result.stdout) if result.stdout else 0}\n", "debug")
+        self.log_message(f"标准错误长度: {len(result.stderr) if result.stderr else 0}\n", "debug")
+
+        if result.returncode == 0:
+            # 解析conda list输出（优先JSON，老版本mamba不支持--json时回退到文本解析）
+            try:
                 try:
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, 
-                                          encoding='utf-8', errors='replace')
-                except UnicodeDecodeError:
-                    # 如果UTF-8解码失败，尝试使用系统默认编码
-                    result = subprocess.run(cmd, shell=True, capture_output=True, text=True, 
-                                          encoding='gbk', errors='replace')
-                
-                self.log_message(f"返回码: {result.returncode}\n", "debug")
-                self.log_message(f"标准输出长度: {len(result.stdout) if result.stdout else 0}\n", "debug")
-                self.log_message(f"标准错误长度: {len(result.stderr) if result.stderr else 0}\n", "debug")
-                
-                if result.returncode == 0:
-                    # 解析conda list输出
-                    try:
-                        packages = self._parse_conda_list_output(result.stdout)
-                        self._display_packages(packages, "conda")
-                        # 记录用户操作
-                        self.log_user_action("Python包查询", "conda包查询成功")
-                    except Exception as parse_error:
-                        self.log_message(f"❌ 解析conda list输出时发生错误: {str(parse_error)}\n", "error")
-                        self.log_message(f"原始输出: {repr(result.stdout[:500])}\n", "debug")
-                        # 记录用户操作
-                        self.log_user_action("Python包查询", f"解析conda输出失败: {str(parse_error)}")
-                else:
-                    self.log_message(f"❌ mamba list执行失败: {result.stderr}\n", "error")
-                    # 记录用户操作
-                    self.log_user_action("Python包查询", f"mamba list执行失败: {result.stderr}")
-                    # 尝试使用pip list作为备选方案
-                    self._query_packages_with_pip(python_cmd)
-            else:
-                # 非conda环境，使用pip list命令
-                self.log_message("📋 使用pip list查询包信息...\n", "info")
+                    package_dicts = json.loads(result.stdout)
+                    packages = [(p.get('name', ''), p.get('version', ''),
+                                 p.get('build_string', p.get('build', '')), p.get('channel', ''))
+                                for p in package_dicts]
+                except (json.JSONDecodeError, AttributeError):
+                    packages = self._parse_conda_list_output(result.stdout)
+                self._display_packages(packages, "conda")
                 # 记录用户操作
-                self.log_user_action("Python包查询", "使用pip list查询包信息")
-                self._query_packages_with_pip(python_cmd)
-                
-        except Exception as e:
-            self.log_message(f"❌ 查询包信息时发生错误: {str(e)}\n", "error")
-            import traceback
-            self.log_message(f"详细错误信息:\n{traceback.format_exc()}\n", "debug")
+                self.log_user_action("Python包查询", "conda包查询成功")
+            except Exception as parse_error:
+                self.log_message(f"❌ 解析conda list输出时发生错误: {str(parse_error)}\n", "error")
+                self.log_message(f"原始输出: {repr(result.stdout[:500])}\n", "debug")
+                # 记录用户操作
+                if self.user_action_logging:
+                    self.log_user_action("Python包查询", f"解析conda输出失败: {str(parse_error)}")
+        else:
+            self.log_message(f"❌ mamba list执行失败: {result.stderr}\n", "error")
             # 记录用户操作
-            self.log_user_action("Python包查询", f"查询异常: {str(e)}")
+            if self.user_action_logging:
+                self.log_user_action("Python包查询", f"mamba list执行失败: {result.stderr}")
+            # 尝试使用pip list作为备选方案
+            self._query_packages_with_pip(python_cmd)
+
+    def _on_package_query_error(self, error_msg):
+        """包查询后台任务异常时在主线程中记录日志"""
+        self.log_message(f"❌ 查询包信息时发生错误: {error_msg}\n", "error")
+        # 记录用户操作
+        if self.user_action_logging:
+            self.log_user_action("Python包查询", f"查询异常: {error_msg}")
     
-    def _get_conda_env_name(self, python_cmd):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_conda_env_name(python_cmd):
         """获取Python解释器对应的conda环境名称
-        
+
+        纯路径解析，结果只取决于传入路径，按解释器路径lru_cache记忆化：
+        切换解释器、运行脚本、包管理等高频入口重复询问同一路径时直接命中。
+
         Args:
             python_cmd (str): Python解释器路径
-            
+
         Returns:
             str or None: conda环境名称，如果不是conda环境则返回None
         """
@@ -6856,13 +7140,31 @@ class NuitkaPackager(QMainWindow):
     
     def _query_packages_with_pip(self, python_cmd):
         """使用pip list查询包信息
-        
+
+        阻塞的pip调用在后台线程池中执行，
+        执行过程中的日志经message_queue回送主线程显示。
+
         Args:
             python_cmd (str): Python解释器路径
         """
         # 记录用户操作
-        self.log_user_action("Python包查询", f"使用pip查询包信息，解释器: {python_cmd}")
-        
+        if self.user_action_logging:
+            self.log_user_action("Python包查询", f"使用pip查询包信息，解释器: {python_cmd}")
+
+        worker = SubprocessWorker(self._run_pip_list, python_cmd)
+        worker.signals.result.connect(self._on_pip_list_result)
+        worker.signals.error.connect(self._on_package_query_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _run_pip_list(self, python_cmd):
+        """在后台线程中尝试多种方式执行pip list（不直接触碰界面）
+
+        Args:
+            python_cmd (str): Python解释器路径
+
+        Returns:
+            tuple or None: (包信息列表, 来源标识)，全部方式失败时返回None
+        """
         # 执行命令的多种方式
         execution_methods = []
         
@@ -6872,9 +7174,9 @@ class NuitkaPackager(QMainWindow):
             # 方法1: 直接调用Scripts目录下的pip.exe
             scripts_dir = os.path.join(os.path.dirname(python_cmd), 'Scripts')
             pip_exe = os.path.join(scripts_dir, 'pip.exe')
-            if os.path.exists(pip_exe):
+            if pathlib.Path(pip_exe).is_file():
                 execution_methods.append([pip_exe])
-                self.log_message(f"📋 检测到pip.exe: {pip_exe}\n", "debug")
+                self.message_queue.put(("log", f"📋 检测到pip.exe: {pip_exe}\n", "debug"))
             
             # 方法2: 使用python -m pip方式
             execution_methods.append([python_cmd, '-m', 'pip'])
@@ -6885,29 +7187,42 @@ class NuitkaPackager(QMainWindow):
             # Linux/macOS系统
             bin_dir = os.path.join(os.path.dirname(python_cmd), 'bin')
             pip_exe = os.path.join(bin_dir, 'pip')
-            if os.path.exists(pip_exe):
+            if pathlib.Path(pip_exe).is_file():
                 execution_methods.append([pip_exe])
             execution_methods.append([python_cmd, '-m', 'pip'])
         
         # 确保至少有一个执行方式
         if not execution_methods:
             execution_methods = [[python_cmd, '-m', 'pip']]
-        
+
+        # 环境变量只构建一次（路径拼接和normpath开销不随重试次数放大）
+        # 添加Python所在目录和Scripts目录到PATH（目录确实存在时才添加）
+        env = os.environ.copy()
+        python_dir = os.path.normpath(os.path.dirname(python_cmd))
+        if sys.platform == "win32":
+            scripts_path = os.path.join(python_dir, 'Scripts')
+            if pathlib.Path(scripts_path).is_dir():
+                env['PATH'] = f"{scripts_path};{python_dir};{env.get('PATH', '')}"
+            else:
+                env['PATH'] = f"{python_dir};{env.get('PATH', '')}"
+        else:
+            bin_path = os.path.join(python_dir, 'bin')
+            if pathlib.Path(bin_path).is_dir():
+                env['PATH'] = f"{bin_path}:{python_dir}:{env.get('PATH', '')}"
+            else:
+                env['PATH'] = f"{python_dir}:{env.get('PATH', '')}"
+
         # 尝试所有执行方式
         for cmd_base in execution_methods:
             try:
                 # 完整命令（添加list参数）
                 cmd = cmd_base + ['list']
-                
+
                 # 记录命令信息
-                self.log_message(f"执行pip命令: {' '.join(cmd)}\n", "debug")
+                self.message_queue.put(("log", f"执行pip命令: {' '.join(cmd)}\n", "debug"))
                 
-                # 设置启动信息（Windows下隐藏命令窗口）
-                startupinfo = None
-                if sys.platform == "win32":
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    startupinfo.wShowWindow = 0
+                # 设置创建标志（Windows下隐藏命令窗口）
+                creationflags = NO_WINDOW_FLAGS
                 
                 # 尝试使用不同的编码执行命令
                 encodings = ['utf-8', 'gbk', 'cp936', 'latin-1']
@@ -6915,25 +7230,14 @@ class NuitkaPackager(QMainWindow):
                 
                 for encoding in encodings:
                     try:
-                        # 创建环境变量副本，添加必要的路径
-                        env = os.environ.copy()
-                        # 添加Python所在目录和Scripts目录到PATH
-                        python_dir = os.path.dirname(python_cmd)
-                        if sys.platform == "win32":
-                            scripts_path = os.path.join(python_dir, 'Scripts')
-                            env['PATH'] = f"{scripts_path};{python_dir};{env.get('PATH', '')}"
-                        else:
-                            bin_path = os.path.join(python_dir, 'bin')
-                            env['PATH'] = f"{bin_path}:{python_dir}:{env.get('PATH', '')}"
-                        
-                        # 执行命令
+                        # 执行命令（env在循环外已构建好）
                         result = subprocess.run(
                             cmd,
                             capture_output=True,
                             text=True,
                             encoding=encoding,
                             errors='replace',
-                            startupinfo=startupinfo,
+                            creationflags=creationflags,
                             shell=False,
                             env=env,
                             timeout=30  # 添加超时保护
@@ -6942,46 +7246,40 @@ class NuitkaPackager(QMainWindow):
                     except UnicodeDecodeError:
                         continue  # 尝试下一个编码
                     except Exception as encode_e:
-                        self.log_message(f"编码 {encoding} 执行失败: {str(encode_e)}\n", "debug")
+                        self.message_queue.put(("log", f"编码 {encoding} 执行失败: {str(encode_e)}\n", "debug"))
                         continue
-                
+
                 if result:
-                    self.log_message(f"pip返回码: {result.returncode}\n", "debug")
-                    self.log_message(f"pip标准输出长度: {len(result.stdout) if result.stdout else 0}\n", "debug")
-                    
+                    self.message_queue.put(("log", f"pip返回码: {result.returncode}\n", "debug"))
+                    self.message_queue.put(("log", f"pip标准输出长度: {len(result.stdout) if result.stdout else 0}\n", "debug"))
+
                     if result.returncode == 0:
                         # 解析pip list输出
                         try:
                             packages = self._parse_pip_list_output(result.stdout)
-                            self._display_packages(packages, "pip")
-                            # 记录用户操作
-                            self.log_user_action("Python包查询", "pip包查询成功")
-                            return  # 成功后直接返回
+                            return packages, "pip"  # 成功后直接返回
                         except Exception as parse_error:
-                            self.log_message(f"❌ 解析pip list输出时发生错误: {str(parse_error)}\n", "error")
-                            self.log_message(f"原始输出: {repr(result.stdout[:500])}\n", "debug")
-                            # 记录用户操作
-                            self.log_user_action("Python包查询", f"解析pip输出失败: {str(parse_error)}")
+                            self.message_queue.put(("log", f"❌ 解析pip list输出时发生错误: {str(parse_error)}\n", "error"))
+                            self.message_queue.put(("log", f"原始输出: {repr(result.stdout[:500])}\n", "debug"))
                             continue  # 尝试下一个执行方式
                     else:
-                        self.log_message(f"❌ pip list执行失败(返回码: {result.returncode}): {result.stderr}\n", "error")
+                        self.message_queue.put(("log", f"❌ pip list执行失败(返回码: {result.returncode}): {result.stderr}\n", "error"))
                         continue  # 尝试下一个执行方式
-                        
+
             except PermissionError:
                 # 处理权限错误
-                self.log_message(f"⚠ 权限错误，尝试其他执行方式\n", "warning")
+                self.message_queue.put(("log", f"⚠ 权限错误，尝试其他执行方式\n", "warning"))
                 continue  # 尝试下一个执行方式
             except Exception as e:
-                self.log_message(f"❌ 执行命令时出错: {str(e)}\n", "error")
+                self.message_queue.put(("log", f"❌ 执行命令时出错: {str(e)}\n", "error"))
                 continue  # 尝试下一个执行方式
-        
+
         # 所有方式都失败了
-        self.log_message(f"❌ 所有pip执行方式都失败了\n", "error")
-        self.log_user_action("Python包查询", "所有pip执行方式都失败")
-        
+        self.message_queue.put(("log", f"❌ 所有pip执行方式都失败了\n", "error"))
+
         # 尝试最后的备选方案：使用pip freeze
         try:
-            self.log_message("尝试使用pip freeze作为备选方案...\n", "info")
+            self.message_queue.put(("log", "尝试使用pip freeze作为备选方案...\n", "info"))
             cmd = [python_cmd, '-m', 'pip', 'freeze']
             result = subprocess.run(
                 cmd,
@@ -6992,24 +7290,37 @@ class NuitkaPackager(QMainWindow):
                 shell=False,
                 timeout=30
             )
-            
+
             if result.returncode == 0:
                 # 解析pip freeze输出
                 try:
-                    packages = []
-                    for line in result.stdout.strip().split('\n'):
-                        if '==' in line:
-                            name, version = line.split('==', 1)
-                            packages.append({'name': name, 'version': version})
-                    
+                    packages = [tuple(line.split('==', 1))
+                                for line in result.stdout.strip().split('\n')
+                                if '==' in line]
                     if packages:
-                        self._display_packages(packages, "pip freeze")
-                        self.log_user_action("Python包查询", "pip freeze查询成功")
-                        return
+                        return packages, "pip freeze"
                 except Exception as parse_error:
-                    self.log_message(f"❌ 解析pip freeze输出失败: {str(parse_error)}\n", "error")
+                    self.message_queue.put(("log", f"❌ 解析pip freeze输出失败: {str(parse_error)}\n", "error"))
         except Exception as e:
-            self.log_message(f"❌ pip freeze执行失败: {str(e)}\n", "error")
+            self.message_queue.put(("log", f"❌ pip freeze执行失败: {str(e)}\n", "error"))
+
+        return None
+
+    def _on_pip_list_result(self, query_result):
+        """pip查询完成后在主线程中显示结果
+
+        Args:
+            query_result (tuple or None): (包信息列表, 来源标识)，失败时为None
+        """
+        if query_result is None:
+            self.log_user_action("Python包查询", "所有pip执行方式都失败")
+            return
+
+        packages, source_type = query_result
+        self._display_packages(packages, source_type)
+        # 记录用户操作
+        if self.user_action_logging:
+            self.log_user_action("Python包查询", f"{source_type}包查询成功")
     
     def _parse_conda_list_output(self, output):
         """解析conda list命令的输出
@@ -7020,28 +7331,12 @@ class NuitkaPackager(QMainWindow):
         Returns:
             list: 包信息列表，每个元素为(包名, 版本, 构建信息, 通道)的元组
         """
-        packages = []
         if not output:
-            return packages
-            
-        lines = output.strip().split('\n')
-        if len(lines) < 3:
-            return packages
-        
-        # 跳过标题行和分隔线，从第3行开始
-        for line in lines[2:]:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # 解析包信息，conda list输出格式: 包名 版本 构建信息 通道
-                parts = line.split()
-                if len(parts) >= 2:
-                    package_name = parts[0]
-                    version = parts[1]
-                    build_info = parts[2] if len(parts) > 2 else ''
-                    channel = parts[3] if len(parts) > 3 else ''
-                    packages.append((package_name, version, build_info, channel))
-        
-        return packages
+            return []
+
+        # conda list输出格式: 包名 版本 构建信息 通道（标题行以#开头，由正则直接跳过）
+        return [(m.group(1), m.group(2), m.group(3) or '', m.group(4) or '')
+                for m in _CONDA_LIST_RE.finditer(output)]
     
     def _parse_pip_list_output(self, output):
         """解析pip list命令的输出
@@ -7052,26 +7347,11 @@ class NuitkaPackager(QMainWindow):
         Returns:
             list: 包信息列表，每个元素为(包名, 版本)的元组
         """
-        packages = []
         if not output:
-            return packages
-            
-        lines = output.strip().split('\n')
-        if len(lines) < 3:
-            return packages
-        
-        # 跳过标题行和分隔线，从第3行开始
-        for line in lines[2:]:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # 解析包信息，pip list输出格式: 包名 版本
-                parts = line.split()
-                if len(parts) >= 2:
-                    package_name = parts[0]
-                    version = parts[1]
-                    packages.append((package_name, version))
-        
-        return packages
+            return []
+
+        # pip list输出格式: 包名 版本（标题行和----分隔线由正则直接跳过）
+        return _PIP_LIST_RE.findall(output)
     
     def _display_packages(self, packages, source_type):
         """在日志中显示包信息
@@ -7084,23 +7364,25 @@ class NuitkaPackager(QMainWindow):
             self.log_message("⚠ 未找到任何已安装的包\n", "warning")
             return
         
-        self.log_message(f"\n📦 找到 {len(packages)} 个已安装的包 (来源: {source_type}):\n", "info")
-        self.log_message("=" * 80 + "\n", "info")
-        
+        # 先把全部内容拼成一个字符串，再一次性写入日志，
+        # 避免每个包触发一次QTextEdit光标移动和重排版
+        lines = [f"\n📦 找到 {len(packages)} 个已安装的包 (来源: {source_type}):", "=" * 80]
+
         if source_type == "conda":
-            # conda包信息显示格式
-            self.log_message(f"{'包名':<20} {'版本':<15} {'构建信息':<20} {'通道':<20}\n", "info")
-            self.log_message("-" * 80 + "\n", "info")
-            for package_name, version, build_info, channel in packages:
-                self.log_message(f"{package_name:<20} {version:<15} {build_info:<20} {channel:<20}\n", "info")
+            # conda包信息显示格式（行格式模板构建一次，循环内只做填充）
+            row_format = "{:<20} {:<15} {:<20} {:<20}".format
+            lines.append(row_format('包名', '版本', '构建信息', '通道'))
+            lines.append("-" * 80)
+            lines.extend(row_format(*package) for package in packages)
         else:
-            # pip包信息显示格式
-            self.log_message(f"{'包名':<30} {'版本':<15}\n", "info")
-            self.log_message("-" * 50 + "\n", "info")
-            for package_name, version in packages:
-                self.log_message(f"{package_name:<30} {version:<15}\n", "info")
-        
-        self.log_message("=" * 80 + "\n", "info")
+            # pip包信息显示格式（行格式模板构建一次，循环内只做填充）
+            row_format = "{:<30} {:<15}".format
+            lines.append(row_format('包名', '版本'))
+            lines.append("-" * 50)
+            lines.extend(row_format(*package) for package in packages)
+
+        lines.append("=" * 80)
+        self.log_message_bulk("\n".join(lines) + "\n", "info")
         self.log_message("✅ 包查询完成\n", "success")
     
     # ================= 依赖扫描方法 =================
@@ -7126,7 +7408,8 @@ class NuitkaPackager(QMainWindow):
         if not os.path.exists(script_path):
             QMessageBox.warning(self, "警告", "主脚本文件不存在")
             # 记录用户操作
-            self.log_user_action("依赖扫描", f"主脚本文件不存在: {script_path}")
+            if self.user_action_logging:
+                self.log_user_action("依赖扫描", f"主脚本文件不存在: {script_path}")
             return
             
         # 检查是否已有依赖扫描线程在运行
@@ -7137,7 +7420,8 @@ class NuitkaPackager(QMainWindow):
             return
         
         # 记录用户操作
-        self.log_user_action("依赖扫描", f"开始扫描依赖，主脚本: {script_path}")
+        if self.user_action_logging:
+            self.log_user_action("依赖扫描", f"开始扫描依赖，主脚本: {script_path}")
         
         # 创建后台线程执行依赖扫描
         thread = DependencyScanThread(script_path)
@@ -7162,12 +7446,16 @@ class NuitkaPackager(QMainWindow):
             self.dependency_scan_thread = None
             
         # 记录用户操作
-        self.log_user_action("依赖扫描", f"扫描完成，找到 {len(custom_modules)} 个外部依赖")
+        if self.user_action_logging:
+            self.log_user_action("依赖扫描", f"扫描完成，找到 {len(custom_modules)} 个外部依赖")
             
         # 如果找到依赖，显示给用户选择
         if custom_modules:
+            # 预先去重并排序，后续计数和列表填充都复用这一份结果
+            unique_modules = sorted(set(custom_modules))
+
             # 记录找到的依赖数量
-            self.log_message(f"找到 {len(custom_modules)} 个可能的外部依赖:\n")
+            self.log_message(f"找到 {len(unique_modules)} 个可能的外部依赖:\n")
             
             # 创建依赖选择对话框
             dialog = QDialog(self)
@@ -7184,7 +7472,7 @@ class NuitkaPackager(QMainWindow):
             # 创建列表控件并添加模块列表
             list_widget = QListWidget()
             list_widget.setSelectionMode(QListWidget.MultiSelection)
-            list_widget.addItems(sorted(set(custom_modules)))  # 去重
+            list_widget.addItems(unique_modules)  # 已预先去重排序，一次性批量添加
             
             # 添加全选按钮
             select_all_layout = QHBoxLayout()
@@ -7216,21 +7504,24 @@ class NuitkaPackager(QMainWindow):
                 selected_items = list_widget.selectedItems()
                 if selected_items:
                     count = 0
+                    # 已有条目集合只构建一次，循环内用set成员判断代替逐项扫描
+                    existing = {self.deps_list.item(i).text() for i in range(self.deps_list.count())}
                     for item in selected_items:
                         module = item.text()
                         dep_item = f"{self.MODULE_PREFIX}{module}"
-                        
+
                         # 检查是否已存在
-                        existing = [self.deps_list.item(i).text() for i in range(self.deps_list.count())]
                         if dep_item not in existing:
                             self.deps_list.addItem(dep_item)
+                            existing.add(dep_item)
                             self.log_message(f"添加模块: {module}\n")
                             count += 1
                     
                     # 记录成功添加的依赖数量
                     self.log_message(f"\n✅ 成功添加 {count} 个依赖模块\n")
                     # 记录用户操作
-                    self.log_user_action("依赖扫描", f"成功添加 {count} 个依赖模块")
+                    if self.user_action_logging:
+                        self.log_user_action("依赖扫描", f"成功添加 {count} 个依赖模块")
                 else:
                     # 记录未选择任何依赖
                     self.log_message("未选择任何依赖模块\n")
@@ -7263,7 +7554,8 @@ class NuitkaPackager(QMainWindow):
         QMessageBox.critical(self, "扫描错误", f"依赖扫描失败: {error_msg}")
         self.log_message(f"⛔ 依赖扫描失败: {error_msg}\n", "error")
         # 记录用户操作
-        self.log_user_action("依赖扫描", f"扫描失败: {error_msg}")
+        if self.user_action_logging:
+            self.log_user_action("依赖扫描", f"扫描失败: {error_msg}")
     
     # ================= 更新方法 =================
     
@@ -7320,7 +7612,7 @@ class NuitkaPackager(QMainWindow):
         # 更新任务数变量
         self.jobs_var = value
         # 更新界面上的任务数显示
-        self.jobs_label.setText(f"任务数: {value} / {os.cpu_count()}")
+        self.jobs_label.setText(f"任务数: {value} / {CPU_COUNT}")
     
     def update_lto(self, lto_level):
         """更新LTO优化等级
@@ -7383,18 +7675,18 @@ class NuitkaPackager(QMainWindow):
                 self.log_message("⚠ 2. 应用程序是否已重启使新的环境变量生效\n", "warning")
             else:
                 self.log_message("✓ 已检测到UPX在环境变量中，可以直接使用\n", "success")
-            
-            # 在插件列表中选择UPX插件
+
+        # 在插件列表中同步UPX插件的选中状态
+        # 只扫描一次列表，更新期间屏蔽信号避免触发多余的选中回调
+        self.plugin_list.blockSignals(True)
+        try:
             for i in range(self.plugin_list.count()):
-                if self.plugin_list.item(i).text() == "upx":
-                    self.plugin_list.item(i).setSelected(True)
-                    break
-        else:
-            # 当禁用UPX时，取消选择UPX插件
-            for i in range(self.plugin_list.count()):
-                if self.plugin_list.item(i).text() == "upx":
-                    self.plugin_list.item(i).setSelected(False)
+                item = self.plugin_list.item(i)
+                if item.text() == "upx":
+                    item.setSelected(state)
                     break
+        finally:
+            self.plugin_list.blockSignals(False)
     
     def is_upx_in_path(self):
         """检查UPX是否在环境变量PATH中
@@ -7403,47 +7695,57 @@ class NuitkaPackager(QMainWindow):
         1. 尝试运行UPX命令
         2. 直接检查PATH环境变量中的所有目录是否包含upx.exe文件
         
+        检测结果会被缓存5秒（PATH被本程序修改时立即失效），连续调用
+        直接命中缓存，同时外部修改PATH也能在几秒内被重新发现。
+
         Returns:
             bool: 如果UPX在PATH中返回True，否则返回False
         """
-        # 方法1：尝试运行UPX命令
-        try:
-            # 调用UPX，隐藏命令行窗口
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = 0
-            
-            # 尝试运行UPX命令检查是否可用
-            subprocess.run(["upx", "-version"], 
-                          stdout=subprocess.DEVNULL, 
-                          stderr=subprocess.DEVNULL,
-                          startupinfo=startupinfo,
-                          timeout=5)  # 添加超时限制
+        # 优先返回未过期的缓存结果
+        cached = self._upx_in_path_cache
+        if cached is not None and time.monotonic() - cached[1] < 5.0:
+            return cached[0]
+
+        result = self._check_upx_in_path()
+        self._upx_in_path_cache = (result, time.monotonic())
+        return result
+
+    def _check_upx_in_path(self):
+        """实际执行UPX的PATH检测（无缓存）
+
+        Returns:
+            bool: 如果UPX在PATH中返回True，否则返回False
+        """
+        # 方法1：在进程内用shutil.which查找，免去启动upx子进程的开销
+        if shutil.which("upx"):
             return True
-        except:
-            # 如果运行失败，尝试方法2
-            pass
         
         # 方法2：直接检查PATH环境变量中的所有目录是否包含upx.exe
+        # 用os.scandir按目录批量读取条目做成员判断，比逐个os.path.isfile的stat调用更快
         try:
             # 获取环境变量PATH
             path_env = os.environ.get("PATH", "")
             # 分割PATH为目录列表
             path_dirs = path_env.split(os.pathsep)
-            
+
             # 检查每个目录是否包含upx.exe
             for path_dir in path_dirs:
                 if not path_dir:  # 跳过空目录
                     continue
-                
-                # 检查upx.exe是否存在于该目录
-                upx_path = os.path.join(path_dir, "upx.exe")
-                if os.path.isfile(upx_path):
+
+                try:
+                    with os.scandir(path_dir) as entries:
+                        names = {entry.name.lower() for entry in entries}
+                except OSError:
+                    # 目录不存在或不可读，跳过
+                    continue
+
+                if "upx.exe" in names:
                     return True
-        except:
-            # 如果检查失败，返回False
+        except OSError:
+            # PATH环境变量读取或目录访问失败时视为未找到
             pass
-        
+
         return False
     
     # ================= UPX 路径设置 =================
@@ -7471,52 +7773,50 @@ class NuitkaPackager(QMainWindow):
             return
             
         try:
-            # 获取当前系统PATH环境变量
+            # 获取当前系统PATH环境变量（只读取和分割一次，后续复用）
             env_path = os.environ["PATH"]
-            
+
             # 检查目录是否已在PATH中
             if upx_dir in env_path.split(os.pathsep):
                 QMessageBox.information(self, "提示", "该目录已在系统PATH中")
                 return
-            
+
             # 1. 先修改当前进程的环境变量，使其立即生效
-            os.environ["PATH"] = f"{upx_dir}{os.pathsep}{os.environ['PATH']}"
+            new_path = f"{upx_dir}{os.pathsep}{env_path}"
+            os.environ["PATH"] = new_path
+            # PATH已变化，失效UPX检测缓存
+            self._upx_in_path_cache = None
             
             # 2. 使用setx命令将路径添加到用户环境变量（不需要管理员权限）
+            # ctypes仅此处用到，延迟导入即可
             import ctypes
-            import sys
-            
+
             # 使用更安全的方式构建setx命令，避免路径中的特殊字符问题
             # 使用-m参数确保添加到用户环境变量，而不是系统环境变量
             # 分别设置参数，避免在一个字符串中混合展开变量
-            
+
             # 将UPX路径设置到系统环境变量（需要管理员权限）
             # 使用/M参数表示设置系统环境变量
             # 先检查是否以管理员权限运行
-            import ctypes
             is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
             
             if is_admin:
-                # 以管理员权限运行，可以设置系统环境变量
-                current_path = os.environ.get("PATH", "")
-                new_path = f"{upx_dir}{os.pathsep}{current_path}"
-                
+                # 以管理员权限运行，可以设置系统环境变量（复用上面构建好的new_path）
+                # 直接调用setx，省去一层cmd.exe进程
                 result = subprocess.run(
-                    ["cmd.exe", "/c", 
-                     "setx", "/M", "PATH", new_path],
+                    ["setx", "/M", "PATH", new_path],
                     capture_output=True,
-                    text=True
+                    text=True,
+                    creationflags=NO_WINDOW_FLAGS
                 )
             else:
-                # 没有管理员权限，先尝试设置用户环境变量
-                current_path = os.environ.get("PATH", "")
-                new_path = f"{upx_dir}{os.pathsep}{current_path}"
-                
+                # 没有管理员权限，先尝试设置用户环境变量（复用上面构建好的new_path）
+                # 直接调用setx，省去一层cmd.exe进程
                 result = subprocess.run(
-                    ["cmd.exe", "/c", 
-                     "setx", "PATH", new_path],
+                    ["setx", "PATH", new_path],
                     capture_output=True,
-                    text=True
+                    text=True,
+                    creationflags=NO_WINDOW_FLAGS
                 )
                 
                 # 记录没有管理员权限的提示
@@ -7664,66 +7964,93 @@ class NuitkaPackager(QMainWindow):
 
         # ================================
 
-        try:
-            # 打开原图标文件并转换为ICO格式
-            with Image.open(icon_path) as img:
-                # 转换为合适的尺寸和格式
-                img = img.resize((256, 256), Image.LANCZOS)
-                img.save(new_ico_path, format="ICO", sizes=[(256, 256)])
-            
-            # 更新界面显示为新生成的 .ico 文件路径
-            self.icon_entry.setText(new_ico_path)
-            
-            # 创建自定义成功提示对话框，设置按钮文本为"确认"
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Information)
-            msg_box.setWindowTitle("成功")
-            msg_box.setText(f"图标已成功转换为ICO格式\n保存位置：{new_ico_path}")
-            
-            # 设置按钮文本为"确认"
-            ok_button = msg_box.addButton("确认", QMessageBox.AcceptRole)
-            
-            # 应用统一样式
-            if hasattr(self, 'dpi_scale'):
-                dpi_scale = self.dpi_scale
-            else:
-                screen = QApplication.primaryScreen()
-                dpi_scale = screen.logicalDotsPerInch() / 96.0
-            
-            # 设置字体
-            font = msg_box.font()
-            font.setFamily("Microsoft YaHei")
-            font.setPointSize(int(12 * dpi_scale))
-            msg_box.setFont(font)
-            
-            # 显示对话框
-            msg_box.exec()
-            
-        except Exception as e:
-            # 创建自定义错误提示对话框，设置按钮文本为"确认"
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Critical)
-            msg_box.setWindowTitle("转换错误")
-            msg_box.setText(f"图标转换失败: {str(e)}")
-            
-            # 设置按钮文本为"确认"
-            ok_button = msg_box.addButton("确认", QMessageBox.AcceptRole)
-            
-            # 应用统一样式
-            if hasattr(self, 'dpi_scale'):
-                dpi_scale = self.dpi_scale
-            else:
-                screen = QApplication.primaryScreen()
-                dpi_scale = screen.logicalDotsPerInch() / 96.0
-            
-            # 设置字体
-            font = msg_box.font()
-            font.setFamily("Microsoft YaHei")
-            font.setPointSize(int(12 * dpi_scale))
-            msg_box.setFont(font)
-            
-            # 显示对话框
-            msg_box.exec()
+        # PIL的图像解码和缩放是CPU密集操作，放入线程池执行避免阻塞界面
+        self.log_message(f"🖼 正在后台转换图标: {icon_path}\n", "info")
+        worker = SubprocessWorker(self._convert_icon_task, icon_path, new_ico_path)
+        worker.signals.result.connect(self._on_icon_converted)
+        worker.signals.error.connect(self._on_icon_convert_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _convert_icon_task(self, icon_path, new_ico_path):
+        """在后台线程中执行实际的图标转换（不触碰界面）
+
+        Args:
+            icon_path (str): 原图标文件路径
+            new_ico_path (str): 目标ICO文件路径
+
+        Returns:
+            str: 转换生成的ICO文件路径
+        """
+        # PIL较重且仅图标转换用到，延迟到实际转换时再导入，加快程序启动
+        from PIL import Image
+
+        # 打开原图标文件并转换为ICO格式
+        with Image.open(icon_path) as img:
+            # 只在原图超过256px时用thumbnail等比缩小（原地操作，比resize少一次拷贝），
+            # 小图无需放大，直接写出
+            if max(img.size) > 256:
+                img.thumbnail((256, 256), Image.LANCZOS)
+            # 一次写出多种尺寸，让Windows在不同场景下都能用到清晰的图标
+            img.save(new_ico_path, format="ICO",
+                     sizes=[(16, 16), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)])
+        return new_ico_path
+
+    def _on_icon_converted(self, new_ico_path):
+        """图标转换完成后在主线程中更新界面并提示用户"""
+        # 更新界面显示为新生成的 .ico 文件路径
+        self.icon_entry.setText(new_ico_path)
+
+        # 创建自定义成功提示对话框，设置按钮文本为"确认"
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Information)
+        msg_box.setWindowTitle("成功")
+        msg_box.setText(f"图标已成功转换为ICO格式\n保存位置：{new_ico_path}")
+
+        # 设置按钮文本为"确认"
+        ok_button = msg_box.addButton("确认", QMessageBox.AcceptRole)
+
+        # 应用统一样式
+        if hasattr(self, 'dpi_scale'):
+            dpi_scale = self.dpi_scale
+        else:
+            screen = QApplication.primaryScreen()
+            dpi_scale = screen.logicalDotsPerInch() / 96.0
+
+        # 设置字体
+        font = msg_box.font()
+        font.setFamily("Microsoft YaHei")
+        font.setPointSize(int(12 * dpi_scale))
+        msg_box.setFont(font)
+
+        # 显示对话框
+        msg_box.exec()
+
+    def _on_icon_convert_failed(self, error_msg):
+        """图标转换失败时在主线程中提示用户"""
+        # 创建自定义错误提示对话框，设置按钮文本为"确认"
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Critical)
+        msg_box.setWindowTitle("转换错误")
+        msg_box.setText(f"图标转换失败: {error_msg}")
+
+        # 设置按钮文本为"确认"
+        ok_button = msg_box.addButton("确认", QMessageBox.AcceptRole)
+
+        # 应用统一样式
+        if hasattr(self, 'dpi_scale'):
+            dpi_scale = self.dpi_scale
+        else:
+            screen = QApplication.primaryScreen()
+            dpi_scale = screen.logicalDotsPerInch() / 96.0
+
+        # 设置字体
+        font = msg_box.font()
+        font.setFamily("Microsoft YaHei")
+        font.setPointSize(int(12 * dpi_scale))
+        msg_box.setFont(font)
+
+        # 显示对话框
+        msg_box.exec()
 
 
 
@@ -7754,42 +8081,8 @@ class NuitkaPackager(QMainWindow):
         dialog.setFixedSize(400, 650)  # 设置固定尺寸
         dialog.setMinimumSize(400, 400)  # 设置最小尺寸
         
-        # 设置对话框样式
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #E3F2FD;  /* 天蓝色背景 */
-                font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
-                color: #000000;  /* 黑色文字 */
-            }
-            QLabel {
-                color: #000000;  /* 黑色文字 */
-                font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
-            }
-            QTextEdit {
-                background-color: #FFFFFF;  /* 白色文本框背景 */
-                color: #000000;  /* 黑色文字 */
-                font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
-                border: 1px solid #BBDEFB;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QPushButton {
-                background-color: #BBDEFB;
-                color: #000000;  /* 黑色文字 */
-                font-family: "SimHei";  /* 黑体字体 */
-                font-size: 16pt;
-                border: 1px solid #90CAF9;
-                border-radius: 5px;
-                padding: 8px 20px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #90CAF9;
-            }
-            QPushButton:pressed {
-                background-color: #64B5F6;
-            }
-        """)
+        # 设置对话框样式（复用类常量）
+        dialog.setStyleSheet(self.DIALOG_TEXT_EDIT_STYLESHEET)
         
         # 创建布局
         layout = QVBoxLayout()
@@ -7828,19 +8121,9 @@ class NuitkaPackager(QMainWindow):
         modules_text = text_edit.toPlainText() if ok else ""
         
         if ok and modules_text.strip():
-            # 解析模块名（支持多种分隔符）
-            modules = []
-            lines = modules_text.strip().split('\n')
-            for line in lines:
-                # 先按逗号分割
-                comma_parts = [part.strip() for part in line.split(',') if part.strip()]
-                # 再按分号分割每个逗号分割的部分
-                for part in comma_parts:
-                    semicolon_parts = [p.strip() for p in part.split(';') if p.strip()]
-                    modules.extend(semicolon_parts)
-            
-            # 去重并过滤空值
-            modules = list(set(module for module in modules if module))
+            # 解析模块名（逗号/分号/换行分隔，一次正则分割完成），去重并过滤空值
+            modules = list({part.strip() for part in _MODULE_SPLIT_RE.split(modules_text)
+                            if part.strip()})
             
             if modules:
                 # 显示将要添加的模块列表
@@ -7854,34 +8137,8 @@ class NuitkaPackager(QMainWindow):
                 confirm_dialog.resize(450, 350)  # 设置初始尺寸，允许用户拖拽调整
                 confirm_dialog.setMinimumSize(350, 250)  # 设置最小尺寸
                 
-                # 设置确认对话框样式
-                confirm_dialog.setStyleSheet("""
-                    QDialog {
-                        background-color: #E3F2FD;  /* 天蓝色背景 */
-                        font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
-                        color: #000000;  /* 黑色文字 */
-                    }
-                    QLabel {
-                        color: #000000;  /* 黑色文字 */
-                        font-family: "Microsoft YaHei", "SimHei";  /* 黑体字体 */
-                    }
-                    QPushButton {
-                        background-color: #BBDEFB;
-                        color: #000000;  /* 黑色文字 */
-                        font-family: "SimHei";  /* 黑体字体 */
-                        font-size: 16pt;
-                        border: 1px solid #90CAF9;
-                        border-radius: 5px;
-                        padding: 8px 20px;
-                        min-width: 80px;
-                    }
-                    QPushButton:hover {
-                        background-color: #90CAF9;
-                    }
-                    QPushButton:pressed {
-                        background-color: #64B5F6;
-                    }
-                """)
+                # 设置确认对话框样式（复用类常量）
+                confirm_dialog.setStyleSheet(self.DIALOG_BASE_STYLESHEET)
                 
                 # 创建布局
                 confirm_layout = QVBoxLayout()
@@ -7910,12 +8167,13 @@ class NuitkaPackager(QMainWindow):
                 confirm = (confirm_result == QDialog.Accepted)
                 
                 if confirm:
-                    # 批量添加模块
-                    for module in modules:
-                        self.deps_list.addItem(f"{self.MODULE_PREFIX}{module}")
-                    # 强制刷新界面显示
-                    self.deps_list.update()
-                    self.deps_list.repaint()
+                    # 批量添加模块（暂停重绘，全部添加完成后一次性刷新）
+                    self.deps_list.setUpdatesEnabled(False)
+                    try:
+                        for module in modules:
+                            self.deps_list.addItem(f"{self.MODULE_PREFIX}{module}")
+                    finally:
+                        self.deps_list.setUpdatesEnabled(True)
                     self.log_message(f"✓ 已批量添加 {len(modules)} 个模块\n", "info")
             else:
                 QMessageBox.warning(self, "警告", "未检测到有效的模块名")
@@ -7954,30 +8212,38 @@ class NuitkaPackager(QMainWindow):
                 )
                 
                 if ok and prefix:
-                    # 为每个文件添加依赖项
-                    for path in paths:
-                        filename = os.path.basename(path)
-                        dest = f"{prefix}{filename}"
-                        self.deps_list.addItem(f"{self.RESOURCE_PREFIX}{path} => {dest}")
-                    # 强制刷新界面显示
-                    self.deps_list.update()
-                    self.deps_list.repaint()
+                    # 为每个文件添加依赖项（暂停重绘，全部添加完成后一次性刷新）
+                    self.deps_list.setUpdatesEnabled(False)
+                    try:
+                        for path in paths:
+                            filename = os.path.basename(path)
+                            dest = f"{prefix}{filename}"
+                            self.deps_list.addItem(f"{self.RESOURCE_PREFIX}{path} => {dest}")
+                    finally:
+                        self.deps_list.setUpdatesEnabled(True)
             else:
-                # 为每个文件单独设置目标路径
-                for path in paths:
-                    default_name = os.path.basename(path)
-                    dest, ok = QInputDialog.getText(
-                        self,
-                        "目标路径",
-                        f"资源文件 {default_name} 将复制到的位置:",
-                        text=f"assets/{default_name}"
-                    )
-                    
-                    if ok and dest:
-                        self.deps_list.addItem(f"{self.RESOURCE_PREFIX}{path} => {dest}")
-                # 强制刷新界面显示
-                self.deps_list.update()
-                self.deps_list.repaint()
+                # 一次弹出多行输入框设置所有目标路径，避免逐文件反复弹窗
+                default_text = "\n".join(f"assets/{os.path.basename(path)}" for path in paths)
+                dests_text, ok = QInputDialog.getMultiLineText(
+                    self,
+                    "目标路径",
+                    "请为每个资源文件设置目标路径（每行对应一个文件，留空行跳过该文件）:",
+                    default_text
+                )
+
+                resource_items = []
+                if ok and dests_text:
+                    for path, dest in zip(paths, dests_text.split('\n')):
+                        dest = dest.strip()
+                        if dest:
+                            resource_items.append(f"{self.RESOURCE_PREFIX}{path} => {dest}")
+
+                if resource_items:
+                    self.deps_list.setUpdatesEnabled(False)
+                    try:
+                        self.deps_list.addItems(resource_items)
+                    finally:
+                        self.deps_list.setUpdatesEnabled(True)
     
     def remove_dependency(self):
         """移除选中的依赖项
@@ -8014,11 +8280,23 @@ class NuitkaPackager(QMainWindow):
             )
         
         if reply == QMessageBox.Yes:
-            # 遍历选中的项并从列表中移除（从后往前删除避免索引问题）
-            for item in reversed(selected_items):
-                row = self.deps_list.row(item)
-                self.deps_list.takeItem(row)
-            
+            # 一次性取得所有行号并合并为连续区段，从后往前整块删除，
+            # 避免逐项takeItem时的重复行查找和多次模型更新
+            rows = sorted(self.deps_list.row(item) for item in selected_items)
+            runs = []
+            start = prev = rows[0]
+            for row in rows[1:]:
+                if row == prev + 1:
+                    prev = row
+                else:
+                    runs.append((start, prev - start + 1))
+                    start = prev = row
+            runs.append((start, prev - start + 1))
+
+            model = self.deps_list.model()
+            for run_start, run_count in reversed(runs):
+                model.removeRows(run_start, run_count)
+
             # 显示删除成功的提示
             self.log_message(f"✓ 已删除 {len(selected_items)} 个依赖项\n", "info")
     
@@ -8044,10 +8322,8 @@ class NuitkaPackager(QMainWindow):
             self.deps_list.clearSelection()
             self.log_message("✓ 已取消全选\n", "info")
         else:
-            # 全选所有项目
-            for i in range(total_items):
-                item = self.deps_list.item(i)
-                item.setSelected(True)
+            # 全选所有项目（selectAll在C++侧一次完成，避免逐项setSelected的N次选中回调）
+            self.deps_list.selectAll()
             self.log_message(f"✓ 已全选 {total_items} 个依赖项\n", "info")
       
       # ================= 打包核心方法 =================
@@ -8066,110 +8342,74 @@ class NuitkaPackager(QMainWindow):
         Returns:
             list: Nuitka编译命令行参数列表，如果验证失败则返回None
         """
-        # 验证主脚本路径是否已选择
+        # 先读取所有待验证的路径，再对每个路径只做一次stat，后续判断复用结果
         script_path = self.script_entry.text().strip()
-        # 标准化路径分隔符为正斜杠
+        output_dir = self.output_entry.text().strip()
+        icon_path = self.icon_entry.text().strip()
+
+        def _stat_exists(path):
+            try:
+                os.stat(path)
+                return True
+            except OSError:
+                return False
+
+        # 验证主脚本路径是否已选择
         # 使用Windows系统默认的路径格式
         if not script_path:
             self.log_message("⛔ 错误：未选择主脚本\n", "error")
             return None
-            
+
         # 验证主脚本文件是否存在
-        if not os.path.exists(script_path):
+        if not _stat_exists(script_path):
             self.log_message(f"⛔ 错误：脚本文件不存在: {script_path}\n", "error")
             return None
-        
+
         # 验证输出目录是否已设置
-        output_dir = self.output_entry.text().strip()
-        # 使用Windows系统默认的路径格式
         if not output_dir:
             self.log_message("⛔ 错误：未设置输出目录\n", "error")
             return None
-            
+
         # 创建输出目录（如果不存在）
-        if not os.path.exists(output_dir):
+        if not _stat_exists(output_dir):
             try:
                 os.makedirs(output_dir, exist_ok=True)
                 self.log_message(f"✓ 已创建输出目录: {output_dir}\n", "info")
             except Exception as e:
                 self.log_message(f"⛔ 创建输出目录失败: {str(e)}\n", "error")
                 return None
-        
+
         # 验证图标文件路径（如果已设置）
-        icon_path = self.icon_entry.text().strip()
-        if icon_path and not os.path.exists(icon_path):
+        if icon_path and not _stat_exists(icon_path):
             self.log_message(f"⚠ 警告：图标文件不存在: {icon_path}\n", "warning")
         
         # 获取Python解释器路径
         python_path = self.python_combo.currentText().strip()
         if not python_path:
             # 如果用户未选择Python解释器，使用当前运行的Python
-            # 修复打包成exe后sys.executable指向exe本身的问题
-            if getattr(sys, 'frozen', False):
-                # 当前是打包后的exe，尝试从环境变量中获取Python路径
-                python_path = os.environ.get('PYTHON_PATH', '')
-                if not python_path or not os.path.exists(python_path):
-                    # 如果环境变量中没有Python路径或路径不存在，使用默认Python
-                    python_path = 'python'
-            else:
-                # 当前是Python脚本，使用sys.executable
-                python_path = sys.executable
+            # 修复打包成exe后sys.executable指向exe本身的问题（frozen状态和PYTHON_PATH已在导入时缓存）
+            python_path = get_fallback_python()
         elif not os.path.exists(python_path):
             self.log_message(f"⚠ 警告：指定的Python解释器不存在: {python_path}，将使用当前Python\n", "warning")
-            if getattr(sys, 'frozen', False):
-                # 当前是打包后的exe，尝试从环境变量中获取Python路径
-                python_path = os.environ.get('PYTHON_PATH', '')
-                if not python_path or not os.path.exists(python_path):
-                    # 如果环境变量中没有Python路径或路径不存在，使用默认Python
-                    python_path = 'python'
-            else:
-                # 当前是Python脚本，使用sys.executable
-                python_path = sys.executable
+            python_path = get_fallback_python()
         else:
             # 验证用户选择的Python解释器
             self.log_message(f"🔍 验证Python解释器: {python_path}\n", "info")
         
-        # 根据优化级别构建基础命令
-        if self.opt_var == 0:
-            # 无优化
-            cmd = [python_path, "-m", "nuitka"]
-        elif self.opt_var == 1:
-            # 基本优化
-            cmd = [python_path, "-O", "-m", "nuitka"]
-        else:  # level 2
-            # 完全优化
-            cmd = [python_path, "-OO", "-m", "nuitka"]
-        
+        # 根据优化级别构建基础命令（查表代替分支，未知级别按完全优化处理）
+        cmd = [python_path] + self.OPT_LEVEL_ARGS.get(self.opt_var, ["-OO"]) + ["-m", "nuitka"]
+
         # 添加自动下载确认参数，避免交互式询问
         cmd.append("--assume-yes-for-downloads")
-       
+
         # 编译器选择（仅Windows平台有效）
-        if self.compiler_var == "msvc":
-            # 使用Microsoft Visual C++编译器
-            cmd.append("--msvc=latest")
-        elif self.compiler_var == "mingw":
-            # 使用MinGW-w64编译器
-            cmd.append("--mingw64")
-        
-        # 打包模式设置
-        if self.mode_var == "onefile":
-            # 单文件模式：将所有内容打包到一个可执行文件中
-            cmd.append("--onefile")
-            # cmd.append("--standalone")
-            
-        else:
-            # 独立模式：生成包含所有依赖的文件夹
-            cmd.append("--standalone")
-        
-        # 控制台设置（仅Windows平台有效）
-        if self.console_var == "enable":
-            # 强制启用控制台窗口
-            cmd.append("--windows-console-mode=force")  # 强制显示控制台窗口（即使你是 GUI 程序）
-            # cmd.append("--windows-console-mode=default")  # 使用默认控制台模式（根据程序类型自动选择，一般会显示控制台）
-        else:
-            # 隐藏控制台窗口
-            cmd.append("--windows-console-mode=disable")  # 完全禁用控制台，适用于纯 GUI 程序（如 PySide6/PyQt 程序）
-            # cmd.append("--windows-console-mode=hide")  # 隐藏控制台窗口（适用于 GUI 程序）
+        cmd.extend(self.COMPILER_ARGS.get(self.compiler_var, []))
+
+        # 打包模式设置（未知取值按独立模式处理）
+        cmd.extend(self.MODE_ARGS.get(self.mode_var, self.MODE_ARGS["standalone"]))
+
+        # 控制台设置（仅Windows平台有效，未知取值按隐藏控制台处理）
+        cmd.extend(self.CONSOLE_ARGS.get(self.console_var, self.CONSOLE_ARGS["disable"]))
         # 输出目录配置
         output_dir = os.path.abspath(output_dir)
         cmd.append(f"--output-dir={output_dir}")
@@ -8186,10 +8426,9 @@ class NuitkaPackager(QMainWindow):
         
         # 图标设置（如果已选择）
         if icon_path:
-            # 使用Windows系统默认的路径格式
+            # 使用Windows系统默认的路径格式（abspath只计算一次）
             icon_path = os.path.abspath(icon_path)
-            # cmd.append(f"--windows-icon-from-ico={icon_path}")
-            cmd.append(f"--windows-icon-from-ico={os.path.abspath(icon_path)}")
+            cmd.append(f"--windows-icon-from-ico={icon_path}")
         
         # LTO链接优化设置
         if self.lto_var and self.lto_var != "off":
@@ -8228,49 +8467,44 @@ class NuitkaPackager(QMainWindow):
         #     # 显示打包进度
         #     cmd.append("--show-progress")
         # 插件启用 - 处理冲突插件
-        selected_plugins = []
-        has_pyside6 = False
-        has_pyqt5 = False
-        
-        # 遍历用户选择的插件列表
-        for item in self.plugin_list.selectedItems():
-            plugin_name = item.text()
-            if plugin_name == "pyside6":
-                has_pyside6 = True
-                selected_plugins.append(plugin_name)
-            elif plugin_name == "pyqt5":
-                has_pyqt5 = True
-                selected_plugins.append(plugin_name)
-            else:
-                selected_plugins.append(plugin_name)
-        
+        # selectedItems()只遍历一次，后续所有成员测试都走集合
+        selected_plugins = [item.text() for item in self.plugin_list.selectedItems()]
+        selected_plugin_names = set(selected_plugins)
+        has_pyside6 = "pyside6" in selected_plugin_names
+        has_pyqt5 = "pyqt5" in selected_plugin_names
+
         # 处理插件冲突：PySide6和PyQt5不能同时使用
         if has_pyside6 and has_pyqt5:
             self.log_message("⚠ 警告：检测到同时启用了PySide6和PyQt5插件，它们存在冲突。将只使用PySide6插件。\n", "warning")
             selected_plugins = [p for p in selected_plugins if p != "pyqt5"]
-        
+            selected_plugin_names.discard("pyqt5")
+
         # UPX压缩设置（如果启用且未在插件列表中选中）
-        if self.upx_var and "upx" not in [item.text() for item in self.plugin_list.selectedItems()]:
+        if self.upx_var and "upx" not in selected_plugin_names:
             selected_plugins.append("upx")
-        
+            selected_plugin_names.add("upx")
+
+        # 脚本导入集合只解析一次（含stat和缓存查找），下面五项检测共用
+        script_modules = self._imported_modules(script_path)
+
         # 检查是否使用了tkinter模块，如果使用了且用户未选择tk-inter插件，则给出提示
-        if self.uses_tkinter(script_path) and "tk-inter" not in selected_plugins:
+        if not script_modules.isdisjoint(self._TKINTER_MODULES) and "tk-inter" not in selected_plugin_names:
             self.log_message("⚠ 警告：检测到脚本中使用了tkinter模块，但未选择tk-inter插件，可能导致运行时错误\n", "warning")
-        
+
         # 检查是否使用了PySide6模块，如果使用了且用户未选择pyside6插件，则给出提示
-        if self.uses_pyside6(script_path) and "pyside6" not in selected_plugins:
+        if not script_modules.isdisjoint(self._QT6_MODULES) and "pyside6" not in selected_plugin_names:
             self.log_message("⚠ 警告：检测到脚本中使用了PySide6模块，但未选择pyside6插件，可能导致运行时错误\n", "warning")
-        
+
         # 检查是否使用了PyQt5模块，如果使用了且用户未选择pyqt5插件，则给出提示
-        if self.uses_pyqt5(script_path) and "pyqt5" not in selected_plugins:
+        if not script_modules.isdisjoint(self._QT5_MODULES) and "pyqt5" not in selected_plugin_names:
             self.log_message("⚠ 警告：检测到脚本中使用了PyQt5模块，但未选择pyqt5插件，可能导致运行时错误\n", "warning")
-        
+
         # 检查是否使用了PIL模块，Nuitka不需要为PIL/Pillow专门启用插件
-        if self.uses_pil(script_path) and "PIL" in selected_plugins:
+        if not script_modules.isdisjoint(self._PIL_MODULES) and "PIL" in selected_plugin_names:
             self.log_message("ℹ 提示：检测到脚本中使用了PIL/Pillow模块，Nuitka会自动处理其依赖，无需专门启用插件\n", "info")
-        
+
         # 检查是否使用了numpy模块，如果使用了且用户未选择numpy插件，则给出提示
-        if self.uses_numpy(script_path) and "numpy" not in selected_plugins:
+        if 'numpy' in script_modules and "numpy" not in selected_plugin_names:
             self.log_message("⚠ 警告：检测到脚本中使用了numpy模块，但未选择numpy插件，可能导致运行时错误\n", "warning")
         
         # 添加插件到命令
@@ -8296,23 +8530,24 @@ class NuitkaPackager(QMainWindow):
                     # cmd.append("--include-package=PySide6")
                     self.log_message("ℹ 提示：已自动包含shiboken6模块以支持PySide6\n", "info")
 
-        # 处理资源文件和模块依赖
-        for i in range(self.deps_list.count()):
-            item = self.deps_list.item(i)
+        # 处理资源文件和模块依赖（item.text()的Qt调用每项只做一次）
+        res_prefix = self.RESOURCE_PREFIX
+        mod_prefix = self.MODULE_PREFIX
+        dep_texts = [self.deps_list.item(i).text() for i in range(self.deps_list.count())]
+        for text in dep_texts:
             # 处理资源文件
-            if item.text().startswith(self.RESOURCE_PREFIX):
-                parts = item.text()[len(self.RESOURCE_PREFIX):].split(" => ")
+            if text.startswith(res_prefix):
+                parts = text[len(res_prefix):].split(" => ")
                 if len(parts) == 2:
                     src, dest = parts
                     # 使用Windows系统默认的路径格式
                     # 添加数据文件到打包目录
                     cmd.append(f"--include-data-files={src}={dest}")
             # 处理额外模块
-            elif item.text().startswith(self.MODULE_PREFIX):
-                module = item.text()[len(self.MODULE_PREFIX):]
+            elif text.startswith(mod_prefix):
                 # 使用Windows系统默认的路径格式
                 # 显式包含指定模块
-                cmd.append(f"--include-module={module}")
+                cmd.append(f"--include-module={text[len(mod_prefix):]}")
         
         # 添加主脚本路径到命令行
         script_path = os.path.abspath(script_path)
@@ -8353,64 +8588,73 @@ class NuitkaPackager(QMainWindow):
             self.log_message("\n=== 手动清理缓存完成 ===\n", "info")
             QMessageBox.information(self, "清理完成", "手动清理缓存操作已完成")
     
-    def _manual_cleanup_build_cache(self):
+    def _manual_cleanup_build_cache(self, output_text=None):
         """手动清理build缓存文件夹
-        
+
         在Nuitka的--remove-output参数可能失败的情况下，手动删除build文件夹
+
+        Args:
+            output_text: 输出目录文本；调用方已读取过时传入，避免重复的Qt控件访问
         """
-        import shutil
-        import glob
-        
         try:
-            # 获取输出目录
-            output_text = self.output_entry.text()
+            # 获取输出目录（未传入时才读取控件）
+            if output_text is None:
+                output_text = self.output_entry.text()
             # 使用Windows系统默认的路径格式
             output_dir = os.path.abspath(output_text)
-            
-            # 查找可能的build文件夹和打包产物
-            # 1. 查找以.build为后缀的文件夹
-            build_patterns = [
-                # 标准构建文件夹
-                os.path.join(output_dir, "*.build"),
-                os.path.join(output_dir, "*.build-*"),
-                os.path.join(output_dir, "build"),
-                os.path.join(output_dir, "build-*"),
-                
-                # dist文件夹和构建产物
-                os.path.join(output_dir, "*.dist"),
-                os.path.join(output_dir, "*.dist-*"),
-                # os.path.join(output_dir, "dist"),
-                # os.path.join(output_dir, "dist-*"),
-                
-                # 单文件构建产物
-                os.path.join(output_dir, ".onefile-build"),
-                os.path.join(output_dir, ".onefile-build-*"),
-                os.path.join(output_dir, "*.onefile-build"),
-                os.path.join(output_dir, "*.onefile-build-*"),
-                
-                
-                # 也检查当前目录下的构建文件夹
-                os.path.join(os.path.dirname(output_dir), "*.build"),
-                os.path.join(os.path.dirname(output_dir), "*.build-*"),
-                os.path.join(os.path.dirname(output_dir), "build"),
-                os.path.join(os.path.dirname(output_dir), "build-*"),
-                os.path.join(os.path.dirname(output_dir), "*.dist"),
-                os.path.join(os.path.dirname(output_dir), "*.dist-*"),
-                # os.path.join(os.path.dirname(output_dir), "dist"),
-                # os.path.join(os.path.dirname(output_dir), "dist-*"),
-                os.path.join(os.path.dirname(output_dir), "*.onefile-build"),
-                os.path.join(os.path.dirname(output_dir), "*.onefile-build-*"),
-            ]
-            
+
+            # 输出目录及其上级目录各列一次，逐项用预编译规则匹配，
+            # 代替之前每个模式都glob一遍同一目录；用集合去重，
+            # 输出目录就是盘符根目录等上级与自身相同的情况只扫描一次
+            parent_dir = os.path.dirname(output_dir)
+            scan_dirs = {output_dir, parent_dir}
+
             cleaned_count = 0
-            
-            for pattern in build_patterns:
-                build_dirs = glob.glob(pattern)
+            temp_files_count = 0
+            build_dirs = []  # 先收集，再并行删除
+
+            for scan_dir in scan_dirs:
+                try:
+                    with os.scandir(scan_dir) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
+
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        # 构建文件夹：.build/.dist/.onefile-build等
+                        if self.CLEANUP_DIR_RE.match(name):
+                            build_dirs.append(entry.path)
+                    elif entry.is_file():
+                        # 单文件编译产生的临时文件：*.c/*.obj/*.manifest等
+                        if self.CLEANUP_FILE_RE.match(name):
+                            try:
+                                self.log_message(f"🧹 正在清理临时文件: {entry.path}\n", "info")
+                                os.remove(entry.path)
+                                self.log_message(f"✅ 成功清理临时文件: {entry.path}\n", "success")
+                                temp_files_count += 1
+                            except PermissionError as e:
+                                self.log_message(f"⚠ 清理临时文件失败（权限不足）: {entry.path} - {e}\n", "warning")
+                            except OSError as e:
+                                self.log_message(f"⚠ 清理临时文件失败（系统错误）: {entry.path} - {e}\n", "warning")
+                            except Exception as e:
+                                self.log_message(f"⚠ 清理临时文件失败（未知错误）: {entry.path} - {e}\n", "warning")
+
+            # 各build文件夹相互独立且删除是I/O密集操作，
+            # 用小线程池并行rmtree重叠文件系统调用的等待时间
+            if build_dirs:
                 for build_dir in build_dirs:
-                    if os.path.exists(build_dir) and os.path.isdir(build_dir):
+                    self.log_message(f"🧹 正在手动清理build文件夹: {build_dir}\n", "info")
+                with ThreadPoolExecutor(max_workers=min(8, len(build_dirs))) as executor:
+                    future_to_dir = {
+                        executor.submit(shutil.rmtree, d, onerror=force_writable): d
+                        for d in build_dirs
+                    }
+                    for future in as_completed(future_to_dir):
+                        build_dir = future_to_dir[future]
                         try:
-                            self.log_message(f"🧹 正在手动清理build文件夹: {build_dir}\n", "info")
-                            shutil.rmtree(build_dir)
+                            future.result()
                             self.log_message(f"✅ 成功清理build文件夹: {build_dir}\n", "success")
                             cleaned_count += 1
                         except PermissionError as e:
@@ -8419,46 +8663,7 @@ class NuitkaPackager(QMainWindow):
                             self.log_message(f"⚠ 清理build文件夹失败（系统错误）: {build_dir} - {e}\n", "warning")
                         except Exception as e:
                             self.log_message(f"⚠ 清理build文件夹失败（未知错误）: {build_dir} - {e}\n", "warning")
-            
-            # 查找并清理单文件编译产生的临时文件
-            temp_patterns = [
-                os.path.join(output_dir, "*.c"),
-                os.path.join(output_dir, "*.cpp"),
-                os.path.join(output_dir, "*.h"),
-                os.path.join(output_dir, "*.o"),
-                os.path.join(output_dir, "*.obj"),
-                os.path.join(output_dir, "*.manifest"),
-                os.path.join(output_dir, "*.lib"),
-                os.path.join(output_dir, "*.exp"),
-                # 也检查当前目录下的临时文件
-                os.path.join(os.path.dirname(output_dir), "*.c"),
-                os.path.join(os.path.dirname(output_dir), "*.cpp"),
-                os.path.join(os.path.dirname(output_dir), "*.h"),
-                os.path.join(os.path.dirname(output_dir), "*.o"),
-                os.path.join(os.path.dirname(output_dir), "*.obj"),
-                os.path.join(os.path.dirname(output_dir), "*.manifest"),
-                os.path.join(os.path.dirname(output_dir), "*.lib"),
-                os.path.join(os.path.dirname(output_dir), "*.exp")
-            ]
-            
-            temp_files_count = 0
-            
-            for pattern in temp_patterns:
-                temp_files = glob.glob(pattern)
-                for temp_file in temp_files:
-                    if os.path.exists(temp_file) and os.path.isfile(temp_file):
-                        try:
-                            self.log_message(f"🧹 正在清理临时文件: {temp_file}\n", "info")
-                            os.remove(temp_file)
-                            self.log_message(f"✅ 成功清理临时文件: {temp_file}\n", "success")
-                            temp_files_count += 1
-                        except PermissionError as e:
-                            self.log_message(f"⚠ 清理临时文件失败（权限不足）: {temp_file} - {e}\n", "warning")
-                        except OSError as e:
-                            self.log_message(f"⚠ 清理临时文件失败（系统错误）: {temp_file} - {e}\n", "warning")
-                        except Exception as e:
-                            self.log_message(f"⚠ 清理临时文件失败（未知错误）: {temp_file} - {e}\n", "warning")
-            
+
             if cleaned_count > 0 or temp_files_count > 0:
                 self.log_message(f"🎉 手动清理完成: 清理了 {cleaned_count} 个build文件夹和 {temp_files_count} 个临时文件\n", "success")
             else:
@@ -8476,66 +8681,41 @@ class NuitkaPackager(QMainWindow):
         - .onefile-build文件夹
         - 临时构建文件
         """
-        import shutil
-        import glob
-        
         try:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             self.log_message(f"🚀 开始快速清理当前目录下的所有构建产物: {current_dir}\n", "info")
-            
-            # 清理模式列表
-            cleanup_patterns = [
-                # 构建文件夹
-                os.path.join(current_dir, "*.build"),
-                os.path.join(current_dir, "*.build-*"),
-                os.path.join(current_dir, "build"),
-                os.path.join(current_dir, "build-*"),
-                
-                # dist文件夹
-                os.path.join(current_dir, "*.dist"),
-                os.path.join(current_dir, "*.dist-*"),
-                # os.path.join(current_dir, "dist"),
-                # os.path.join(current_dir, "dist-*"),
-                
-                # 单文件构建
-                os.path.join(current_dir, "*.onefile-build"),
-                os.path.join(current_dir, "*.onefile-build-*"),
-                os.path.join(current_dir, ".onefile-build"),
-                os.path.join(current_dir, ".onefile-build-*"),
-                
-
-                
-                # 临时文件
-                os.path.join(current_dir, "*.c"),
-                os.path.join(current_dir, "*.cpp"),
-                os.path.join(current_dir, "*.h"),
-                os.path.join(current_dir, "*.o"),
-                os.path.join(current_dir, "*.obj"),
-                os.path.join(current_dir, "*.manifest"),
-                os.path.join(current_dir, "*.lib"),
-                os.path.join(current_dir, "*.exp"),
-                os.path.join(current_dir, "*.pdb")
-            ]
-            
+
+            # 当前目录只列一次，逐项用预编译规则匹配
+            try:
+                with os.scandir(current_dir) as it:
+                    entries = list(it)
+            except OSError:
+                entries = []
+
             total_cleaned = 0
-            
-            for pattern in cleanup_patterns:
-                items = glob.glob(pattern)
-                for item in items:
-                    if os.path.exists(item):
-                        try:
-                            if os.path.isdir(item):
-                                self.log_message(f"🧹 正在清理文件夹: {os.path.basename(item)}\n", "info")
-                                shutil.rmtree(item)
-                                self.log_message(f"✅ 成功清理文件夹: {os.path.basename(item)}\n", "success")
-                            else:
-                                self.log_message(f"🧹 正在清理文件: {os.path.basename(item)}\n", "info")
-                                os.remove(item)
-                                self.log_message(f"✅ 成功清理文件: {os.path.basename(item)}\n", "success")
+
+            for entry in entries:
+                name = entry.name
+                # 廉价预筛：不含构建产物特征的名字直接跳过正则匹配
+                lower_name = name.lower()
+                if 'build' not in lower_name and '.dist' not in lower_name \
+                        and not lower_name.endswith(self.CLEANUP_FILE_SUFFIXES):
+                    continue
+                try:
+                    if entry.is_dir():
+                        if self.CLEANUP_DIR_RE.match(name):
+                            self.log_message(f"🧹 正在清理文件夹: {name}\n", "info")
+                            shutil.rmtree(entry.path, onerror=force_writable)
+                            self.log_message(f"✅ 成功清理文件夹: {name}\n", "success")
                             total_cleaned += 1
-                        except Exception as e:
-                            self.log_message(f"⚠ 清理失败: {os.path.basename(item)} - {e}\n", "warning")
-            
+                    elif self.QUICK_CLEANUP_FILE_RE.match(name):
+                        self.log_message(f"🧹 正在清理文件: {name}\n", "info")
+                        os.remove(entry.path)
+                        self.log_message(f"✅ 成功清理文件: {name}\n", "success")
+                        total_cleaned += 1
+                except Exception as e:
+                    self.log_message(f"⚠ 清理失败: {name} - {e}\n", "warning")
+
             if total_cleaned > 0:
                 self.log_message(f"🎉 快速清理完成！共清理了 {total_cleaned} 个构建产物\n", "success")
             else:
@@ -8544,10 +8724,19 @@ class NuitkaPackager(QMainWindow):
         except Exception as e:
             self.log_message(f"⛔ 快速清理过程中发生错误: {e}\n", "error")
     
-    def escape_powershell_arg(self, arg):
-        """转义PowerShell命令行参数，正确处理包含空格和特殊字符的路径"""
+    # PowerShell需要加引号的特殊字符，一次正则扫描代替逐字符的多次in检查
+    _PS_SPECIAL_RE = re.compile(r'''[ \\"']''')
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def escape_powershell_arg(arg):
+        """转义PowerShell命令行参数，正确处理包含空格和特殊字符的路径
+
+        结果只取决于参数本身，解释器路径、--enable-plugin=等参数在
+        多次打包之间反复出现，用lru_cache直接复用转义结果。
+        """
         # 如果参数中包含空格或特殊字符，使用双引号包围
-        if ' ' in arg or '\\' in arg or '"' in arg or "'" in arg:
+        if NuitkaPackager._PS_SPECIAL_RE.search(arg):
             # 先替换参数中的双引号为两个双引号（PowerShell转义规则）
             escaped_arg = arg.replace('"', '""')
             # 再用双引号包围整个参数
@@ -8577,7 +8766,10 @@ class NuitkaPackager(QMainWindow):
         current_stage = 'initialization'
         compilation_units = []
         linking_files = 0
-        
+
+        # 输出目录只从Qt控件读取一次，后续（成功提示、清理）复用本地值
+        output_text = self.output_entry.text()
+
         try:
             cmd = self.build_nuitka_command()
             if cmd is None:
@@ -8589,11 +8781,7 @@ class NuitkaPackager(QMainWindow):
             # 在日志中明确提示将自动确认下载
             self.message_queue.put(("log", "✅ 已启用自动下载确认 (--assume-yes-for-downloads)\n", "info"))
             
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
+            creationflags = NO_WINDOW_FLAGS
             
             env = os.environ.copy()
             upx_path = self.upx_path_entry.text().strip()
@@ -8623,71 +8811,78 @@ class NuitkaPackager(QMainWindow):
             # 检查是否为conda环境
             conda_env_name = self._get_conda_env_name(python_cmd)
             
-            # 使用subprocess执行命令，Windows系统下使用shell=True
+            # 统一以参数列表直接执行（shell=False）：省去shell解析和引号转义，
+            # conda环境通过注入环境变量生效，不再经由conda activate间接启动
             if conda_env_name:
-                # 如果是conda环境，先激活环境再执行命令
-                activate_cmd = f'conda activate {conda_env_name} && '
-                
-                # 添加功能：在执行打包命令前，先查询该环境安装的库明细
-                list_cmd = activate_cmd + 'conda list'
-                self.message_queue.put(("log", f"🔍 查询conda环境 {conda_env_name} 的库明细...\n"))
-                self.message_queue.put(("log", f"📋 执行命令: {list_cmd}\n"))
-                
+                # 添加功能：在执行打包命令前，先查询该环境安装的库明细。
+                # 同一会话内环境未变化时直接重放缓存结果，跳过conda list子进程；
+                # 以conda-meta目录下最新的mtime作为环境是否变化的哨兵
+                conda_meta_dir = os.path.join(python_dir, 'conda-meta')
+                meta_sentinel = 0.0
                 try:
-                    # 执行conda list命令
-                    list_proc = subprocess.Popen(
-                        list_cmd,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.STDOUT,
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True,
-                        startupinfo=startupinfo,
-                        shell=True
-                    )
-                    
-                    # 输出conda list的结果
-                    line_count = 0
-                    for line in list_proc.stdout:
-                        self.message_queue.put(("log", f"{line}"))
-                        line_count += 1
-                    
-                    list_proc.wait()
-                    self.message_queue.put(("log", f"✅ conda list命令执行完成，共输出 {line_count} 行\n"))
-                    
-                except Exception as e:
-                    self.message_queue.put(("log", f"⚠ conda list命令执行失败: {str(e)}\n"))
-                
-                # 执行原始的打包命令
-                full_cmd = activate_cmd + ' '.join([self.escape_powershell_arg(arg) for arg in cmd])
-                self.message_queue.put(("log", f"🚀 激活conda环境: {conda_env_name}\n"))
-                self.message_queue.put(("log", f"📋 执行完整命令: {full_cmd}\n"))
-                self.proc = subprocess.Popen(
-                    full_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    env=env,
-                    shell=True
-                )
-            else:
-                # Windows系统下使用shell=True执行命令
-                cmd_str = ' '.join([self.escape_powershell_arg(arg) for arg in cmd])
-                self.message_queue.put(("log", f"📋 执行命令: {cmd_str}\n"))
-                self.proc = subprocess.Popen(
-                    cmd_str,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    env=env,
-                    shell=True
-                )
+                    with os.scandir(conda_meta_dir) as it:
+                        meta_sentinel = max((e.stat().st_mtime for e in it), default=0.0)
+                except OSError:
+                    pass
+
+                cached_list = self._conda_list_cache.get(conda_env_name)
+                self.message_queue.put(("log", f"🔍 查询conda环境 {conda_env_name} 的库明细...\n"))
+
+                if meta_sentinel and cached_list is not None and cached_list[0] == meta_sentinel:
+                    # 环境未变化，直接输出缓存内容（一次put）
+                    self.message_queue.put(("log_batch", cached_list[1]))
+                    self.message_queue.put(("log", f"✅ conda环境未变化，使用缓存的库明细（共 {cached_list[1].count(chr(10))} 行）\n"))
+                else:
+                    list_cmd = ["conda", "list", "-n", conda_env_name]
+                    self.message_queue.put(("log", f"📋 执行命令: {' '.join(list_cmd)}\n"))
+
+                    try:
+                        # 执行conda list命令（-n指定环境，无需激活）
+                        list_proc = subprocess.Popen(
+                            list_cmd,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.STDOUT,
+                            text=True,
+                            bufsize=1,
+                            universal_newlines=True,
+                            creationflags=creationflags,
+                            shell=False
+                        )
+
+                        # 输出conda list的结果，同时收集文本供下次复用
+                        list_lines = []
+                        for line in list_proc.stdout:
+                            self.message_queue.put(("log", f"{line}"))
+                            list_lines.append(line)
+
+                        list_proc.wait()
+                        if meta_sentinel:
+                            self._conda_list_cache[conda_env_name] = (meta_sentinel, ''.join(list_lines))
+                        self.message_queue.put(("log", f"✅ conda list命令执行完成，共输出 {len(list_lines)} 行\n"))
+
+                    except Exception as e:
+                        self.message_queue.put(("log", f"⚠ conda list命令执行失败: {str(e)}\n"))
+
+                # 注入conda前缀变量代替activate：PATH前面已加入解释器和
+                # Scripts目录，这里补上Library\bin（DLL查找）和前缀标识
+                env['CONDA_PREFIX'] = python_dir
+                env['CONDA_DEFAULT_ENV'] = conda_env_name
+                library_bin = os.path.join(python_dir, 'Library', 'bin')
+                if os.path.isdir(library_bin) and library_bin not in env["PATH"]:
+                    env["PATH"] = f"{library_bin}{os.pathsep}{env['PATH']}"
+                self.message_queue.put(("log", f"🚀 使用conda环境: {conda_env_name}\n"))
+
+            # 打包命令以参数列表直接执行，conda与普通环境共用同一调用
+            self.message_queue.put(("log", f"📋 执行完整命令: {' '.join(cmd)}\n"))
+            self.proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1 << 16,
+                creationflags=creationflags,
+                env=env,
+                shell=False
+            )
             
             progress = 0
             last_progress = 0
@@ -8700,24 +8895,50 @@ class NuitkaPackager(QMainWindow):
             estimated_total_files = 0  # 初始化估算总文件数
             c_linking_total_files = 0  # C链接阶段总文件数
             c_linking_processed_files = 0  # C链接阶段已处理文件数
-            
-            for line in self.proc.stdout:
+            last_clink_log_pct = -1  # 上次输出的C链接进度百分比（去重用）
+
+            # 普通输出行攒批后一次put（满32行或超过50ms即冲刷），
+            # 减少队列锁竞争和GUI刷新次数；进度和阶段提示仍即时put保证响应性
+            pending_lines = []
+            last_flush = time.monotonic()
+
+            # stdout以二进制大块缓冲读取（代替text=True+bufsize=1的逐行解码），
+            # 文本解码交给TextIOWrapper；errors='replace'避免个别非法字节中断日志
+            stdout_reader = io.TextIOWrapper(
+                self.proc.stdout,
+                encoding=locale.getpreferredencoding(False),
+                errors='replace'
+            )
+
+            for line in stdout_reader:
                 if not self.running:
                     break
-                    
-                self.message_queue.put(("log", line))
-                
-                # 增强的进度匹配和阶段检测
-                match = self.PROGRESS_PATTERN.search(line)
-                if match:
-                    progress = int(match.group(1))
+
+                pending_lines.append(line)
+                now = time.monotonic()
+                if len(pending_lines) >= 32 or now - last_flush > 0.05:
+                    self.message_queue.put(("log_batch", ''.join(pending_lines)))
+                    pending_lines = []
+                    last_flush = now
+
+                # 增强的进度匹配和阶段检测（先做廉价子串预筛，正则只扫描少数候选行）
+                # 进度与阶段标记在STAGE_MARKER_RE里合并，每行至多一次正则扫描
+                # （廉价预筛：进度行必含'%'，阶段行必含热点大写字母之一）
+                if '%' in line or not self.STAGE_HOT_CHARS.isdisjoint(line):
+                    stage_match = self.STAGE_MARKER_RE.search(line)
+                else:
+                    stage_match = None
+                marker = stage_match.lastgroup if stage_match else None
+
+                if marker == 'progress_pct':
+                    progress = int(stage_match.group('progress_pct'))
                     self.message_queue.put(("progress", progress))
                     last_progress = progress
                     timeout_counter = 0
                     stuck_at_99_counter = 0  # 重置99%卡住计数器
                 else:
-                    # 检测各个编译阶段
-                    if "Analyzing dependencies" in line or "Dependency analysis" in line:
+                    # 检测各个编译阶段：lastgroup标识命中的阶段
+                    if marker == 'dep_analysis':
                         current_stage = 'dependency_analysis'
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 10)
                         # 确保进度不会倒退
@@ -8725,8 +8946,8 @@ class NuitkaPackager(QMainWindow):
                             self.message_queue.put(("progress", progress))
                             last_progress = progress
                         self.message_queue.put(("log", "\n🔍 正在分析项目依赖关系...\n", "info"))
-                    
-                    elif "Compiling" in line and "module" in line.lower():
+
+                    elif marker == 'module_compile' and "module" in line.lower():
                         current_stage = 'module_compilation'
                         total_files_processed += 1
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 25, total_files_processed)
@@ -8734,8 +8955,8 @@ class NuitkaPackager(QMainWindow):
                         if progress > last_progress:
                             self.message_queue.put(("progress", progress))
                             last_progress = progress
-                    
-                    elif "Generating C code" in line or "Code generation" in line:
+
+                    elif marker == 'code_gen':
                         current_stage = 'code_generation'
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 50)
                         # 确保进度不会倒退
@@ -8743,8 +8964,8 @@ class NuitkaPackager(QMainWindow):
                             self.message_queue.put(("progress", progress))
                             last_progress = progress
                         self.message_queue.put(("log", "\n⚡ 正在生成C代码...\n", "info"))
-                    
-                    elif "Nuitka-Scons:" in line and "compiling" in line:
+
+                    elif marker == 'scons_compile':
                         current_stage = 'c_compilation'
                         total_files_processed += 1
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 70, total_files_processed)
@@ -8752,10 +8973,10 @@ class NuitkaPackager(QMainWindow):
                         if progress > last_progress:
                             self.message_queue.put(("progress", progress))
                             last_progress = progress
-                    
-                    elif c_linking_match := self.C_LINKING_PATTERN.search(line):
+
+                    elif marker == 'c_linking':
                         current_stage = 'c_linking'
-                        c_linking_total_files = int(c_linking_match.group(1))
+                        c_linking_total_files = int(self.C_LINKING_PATTERN.search(line).group(1))
                         c_linking_processed_files = 0  # 重置已处理文件计数
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 75, c_linking_processed_files)
                         # 确保进度不会倒退
@@ -8765,8 +8986,8 @@ class NuitkaPackager(QMainWindow):
                         self.message_queue.put(("log", f"\n🔧 进入C链接阶段，正在处理{c_linking_total_files}个编译文件...\n", "info"))
                         timeout_counter = 0
                         stuck_at_99_counter = 0
-                    
-                    elif linking_match := self.LINKING_PATTERN.search(line):
+
+                    elif marker == 'final_linking':
                         current_stage = 'final_linking'
                         progress = self.calculate_stage_progress(stage_progress, current_stage, 95)
                         # 确保进度不会倒退
@@ -8775,18 +8996,18 @@ class NuitkaPackager(QMainWindow):
                             last_progress = progress
                         self.message_queue.put(("log", "\n🔗 正在进行最终链接操作...\n", "info"))
                         timeout_counter = 0
-                    
-                    elif "Done." in line or "Successfully created" in line:
+
+                    elif marker == 'done':
                         current_stage = 'completion'
                         progress = 100
                         self.message_queue.put(("progress", progress))
-                    
+
                     # 检测编译单元和文件数量
-                    elif "Compilation unit" in line:
+                    elif marker == 'comp_unit':
                         compilation_units.append(line.strip())
                         if not estimated_total_files:
                             estimated_total_files = len(compilation_units) * 2  # 估算总文件数
-                    
+
                     # 检测C链接阶段的具体编译进度
                     elif current_stage == 'c_linking' and c_linking_total_files > 0:
                         # 检测各种编译完成模式
@@ -8801,9 +9022,12 @@ class NuitkaPackager(QMainWindow):
                             if progress > last_progress:
                                 self.message_queue.put(("progress", progress))
                                 last_progress = progress
-                            # 每处理10个文件显示一次进度
-                            if c_linking_processed_files % 10 == 0 or c_linking_processed_files == c_linking_total_files:
-                                self.message_queue.put(("log", f"📊 C链接进度: {c_linking_processed_files}/{c_linking_total_files} ({progress:.0f}%)\n", "info"))
+                            # 每处理10个文件显示一次进度（百分比没变化就不重复输出）
+                            clink_pct = int(progress)
+                            if (c_linking_processed_files % 10 == 0 or c_linking_processed_files == c_linking_total_files) \
+                                    and clink_pct != last_clink_log_pct:
+                                self.message_queue.put(("log", f"📊 C链接进度: {c_linking_processed_files}/{c_linking_total_files} ({clink_pct}%)\n", "info"))
+                                last_clink_log_pct = clink_pct
                             timeout_counter = 0
                     
                     else:
@@ -8827,7 +9051,11 @@ class NuitkaPackager(QMainWindow):
                                 self.message_queue.put(("progress", progress))
                                 last_progress = progress
                             timeout_counter = 0
-            
+
+            # 冲刷最后一批未满的输出行
+            if pending_lines:
+                self.message_queue.put(("log_batch", ''.join(pending_lines)))
+
             return_code = self.proc.wait()
             
             if return_code == 0 and self.running:
@@ -8838,9 +9066,8 @@ class NuitkaPackager(QMainWindow):
                 self.message_queue.put(("log", "="*30 + "\n"))
                 
                 # 显示成功信息
-                output_dir = self.output_entry.text()
                 # 使用Windows系统默认的路径格式
-                self.message_queue.put(("log", f"输出目录: {os.path.abspath(output_dir)}\n", "info"))
+                self.message_queue.put(("log", f"输出目录: {os.path.abspath(output_text)}\n", "info"))
             elif self.running:
                 total_time = time.time() - start_time
                 self.message_queue.put(("progress", 100))
@@ -8862,34 +9089,37 @@ class NuitkaPackager(QMainWindow):
         finally:
             # 如果启用了清理缓存且打包成功，尝试手动清理build文件夹
             if self.cleanup_cache and return_code == 0:
-                self._manual_cleanup_build_cache()
+                self._manual_cleanup_build_cache(output_text)
             
             self.message_queue.put(("running", False))
             self.running = False
             self.message_queue.put(("enable_button", True))
     
+    # 各编译阶段对应的进度区间与按文件数计算进度的阶段集合
+    # （类常量，避免每次进度事件都重建dict和list）
+    STAGE_RANGES = {
+        'initialization': (0, 5),
+        'dependency_analysis': (5, 15),
+        'module_compilation': (15, 40),
+        'code_generation': (40, 60),
+        'c_compilation': (60, 75),
+        'c_linking': (75, 90),
+        'final_linking': (90, 98),
+        'completion': (98, 100),
+    }
+    FILE_COUNT_STAGES = frozenset({'module_compilation', 'c_compilation', 'c_linking'})
+
     def calculate_stage_progress(self, stage_progress, current_stage, base_progress, file_count=0):
         """根据当前阶段和文件数量计算更精确的进度"""
-        stage_ranges = {
-            'initialization': (0, 5),
-            'dependency_analysis': (5, 15),
-            'module_compilation': (15, 40),
-            'code_generation': (40, 60),
-            'c_compilation': (60, 75),
-            'c_linking': (75, 90),
-            'final_linking': (90, 98),
-            'completion': (98, 100)
-        }
-        
-        min_progress, max_progress = stage_ranges.get(current_stage, (0, 100))
-        
+        min_progress, max_progress = self.STAGE_RANGES.get(current_stage, (0, 100))
+
         # 确保基础进度至少在阶段范围内
         if base_progress < min_progress:
             base_progress = min_progress
         elif base_progress > max_progress:
             base_progress = max_progress
-        
-        if current_stage in ['module_compilation', 'c_compilation', 'c_linking'] and file_count > 0:
+
+        if file_count > 0 and current_stage in self.FILE_COUNT_STAGES:
             # 对于有文件计数的阶段，根据文件数量计算进度
             progress_range = max_progress - min_progress
             
@@ -8980,10 +9210,13 @@ class NuitkaPackager(QMainWindow):
         # 显示打包开始状态
         self.log_message("🚀 开始打包进程...\n", "info")
         
-        # 重置进度条状态
+        # 重置进度条状态（同步重置check_queue的跳过缓存，
+        # 否则绕过缓存的直接写入会让后续相同进度值被误判为未变化）
         self.progress.setValue(0)
         self.progress.setFormat("%p% - 开始打包...")
-        
+        self._last_progress_val = 0
+        self._last_progress_fmt = None
+
         # 记录打包开始
         self.log_user_action("启动打包进程", "开始后台Nuitka打包")
         threading.Thread(target=self.run_nuitka, daemon=True).start()
@@ -9025,72 +9258,109 @@ class NuitkaPackager(QMainWindow):
                 self.stop_button.setEnabled(False)
                 self.export_button.setEnabled(True)
                 
-                # 重置进度条状态
+                # 重置进度条状态（并同步check_queue的跳过缓存）
                 self.progress.setValue(0)
                 self.progress.setFormat("%p% - 已停止")
-                
+                self._last_progress_val = 0
+                self._last_progress_fmt = None
+
                 # 记录用户操作
                 self.log_user_action("打包已停止", "用户停止打包进程完成")
     
     # ================= UI 更新方法 =================
     
     def check_queue(self):
+        """取空消息队列后一次性更新界面
+
+        每个定时周期先把队列消息全部取出再更新控件：相同标签的
+        连续日志合并成一次插入，进度只保留最后一个值，按钮状态在
+        取空后统一应用，避免每条消息都触发一次QTextEdit重排版和
+        进度条重绘。
+        """
+        pending_log_text = []   # 待插入的连续同标签日志
+        pending_log_tag = None
+        last_progress = None
+        enable_button = False
+        running_value = None
+
+        # 按消息类型的分发表：循环内一次字典查找代替逐个字符串比较，
+        # 闭包通过nonlocal写入上面的累积变量
+        def _on_log(msg):
+            nonlocal pending_log_text, pending_log_tag
+            text = msg[1]
+            tag = msg[2] if len(msg) > 2 else None
+            # 标签变化时先把已攒的同色日志整体插入
+            if pending_log_text and tag != pending_log_tag:
+                self.log_message_bulk(''.join(pending_log_text), pending_log_tag)
+                pending_log_text = []
+            pending_log_text.append(text)
+            pending_log_tag = tag
+
+        def _on_progress(msg):
+            nonlocal last_progress
+            last_progress = msg[1]
+
+        def _on_enable_button(msg):
+            nonlocal enable_button
+            enable_button = True
+
+        def _on_running(msg):
+            nonlocal running_value
+            running_value = msg[1]
+
+        handler_get = {
+            "log": _on_log,
+            "log_batch": _on_log,
+            "progress": _on_progress,
+            "enable_button": _on_enable_button,
+            "running": _on_running,
+        }.get
+
+        # 只依赖Empty异常终止取空循环：省掉empty()的额外一次加锁，
+        # get_nowait绑定到局部变量减少循环内的属性查找
+        get_nowait = self.message_queue.get_nowait
         try:
-            while not self.message_queue.empty():
-                msg = self.message_queue.get_nowait()
-                msg_type = msg[0]
-                
-                if msg_type == "log":
-                    text = msg[1]
-                    if len(msg) > 2:
-                        tag = msg[2]
-                        self.log_message(text, tag)
-                    else:
-                        self.log_message(text)
-                    
-                elif msg_type == "progress":
-                    progress_value = msg[1]
-                    # 防止进度突然变为0（除非是初始化状态）
-                    if progress_value == 0 and self.running:
-                        # 如果正在运行中，进度不应该为0，保持上一次的进度
-                        progress_value = self.progress.value()
-                    
-                    self.progress.setValue(progress_value)
-                    
-                    # 根据进度值更新状态文本，提供更精确的阶段信息
-                    if progress_value == 0:
-                        status_text = "准备就绪"
-                    elif progress_value < 5:
-                        status_text = "正在初始化..."
-                    elif progress_value < 15:
-                        status_text = "🔍 正在分析项目依赖关系..."
-                    elif progress_value < 40:
-                        status_text = f"📦 正在编译模块 ({progress_value:.0f}%)..."
-                    elif progress_value < 60:
-                        status_text = "⚡ 正在生成C代码..."
-                    elif progress_value < 75:
-                        status_text = f"🔨 正在编译C代码 ({progress_value:.0f}%)..."
-                    elif progress_value < 90:
-                        status_text = f"🔧 C链接处理中 ({progress_value:.0f}%)..."
-                    elif progress_value < 98:
-                        status_text = "🔗 最终链接中..."
-                    elif progress_value < 100:
-                        status_text = "📋 正在完成打包..."
-                    else:  # 100%
-                        status_text = "✅ 打包完成"
-                    
-                    self.progress.setFormat(f"%p% - {status_text}")
-                    
-                elif msg_type == "enable_button":
-                    self.start_button.setEnabled(True)
-                    self.stop_button.setEnabled(False)
-                    self.export_button.setEnabled(True)
-                    
-                elif msg_type == "running":
-                    self.running = msg[1]
-        
+            while True:
+                msg = get_nowait()
+                handler = handler_get(msg[0])
+                if handler is not None:
+                    handler(msg)
         except queue.Empty:
             pass
+
+        if pending_log_text:
+            self.log_message_bulk(''.join(pending_log_text), pending_log_tag)
+
+        if running_value is not None:
+            self.running = running_value
+
+        if last_progress is not None:
+            progress_value = last_progress
+            # 防止进度突然变为0（除非是初始化状态）
+            if progress_value == 0 and self.running:
+                # 如果正在运行中，进度不应该为0，保持上一次的进度
+                progress_value = self.progress.value()
+
+            # 值和格式都只在变化时才写回控件，避免相同值反复触发重绘
+            if progress_value != self._last_progress_val:
+                self.progress.setValue(progress_value)
+                self._last_progress_val = progress_value
+
+            # 根据进度值更新状态文本：查表定位区间，按需格式化百分比
+            idx = bisect.bisect_right(self.PROGRESS_STATUS_THRESHOLDS, progress_value)
+            status_text = self.PROGRESS_STATUS_TEXTS[idx]
+            if "{p" in status_text:
+                status_text = status_text.format(p=progress_value)
+
+            progress_fmt = f"%p% - {status_text}"
+            if progress_fmt != self._last_progress_fmt:
+                self.progress.setFormat(progress_fmt)
+                self._last_progress_fmt = progress_fmt
+
+        if enable_button:
+            self.start_button.setEnabled(True)
+            self.stop_button.setEnabled(False)
+            self.export_button.setEnabled(True)
     
 
     def _initialize_scroll_position(self):
@@ -9132,6 +9402,9 @@ class NuitkaPackager(QMainWindow):
     
     def _init_logging(self):
         """初始化日志记录功能"""
+        self._log_fh = None  # 常驻日志文件句柄（由后台写入线程独占使用）
+        self._log_writer_q = None  # 日志写入队列：主线程入队，后台线程落盘
+        self._log_writer_thread = None
         try:
             # 创建日志目录
             os.makedirs(self.log_dir, exist_ok=True)
@@ -9140,8 +9413,8 @@ class NuitkaPackager(QMainWindow):
             current_python = self.python_combo.currentText().strip() if hasattr(self, 'python_combo') else sys.executable
             
             # 生成日志文件名（基于时间戳和Python路径）
-            import hashlib
-            python_hash = hashlib.md5(current_python.encode('utf-8')).hexdigest()[:8]
+            # 仅用作区分不同Python路径的短标识，crc32校验和即可，无需md5
+            python_hash = f"{zlib.crc32(current_python.encode('utf-8')) & 0xffffffff:08x}"
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             log_filename = f"nuitka_log_{timestamp}_{python_hash}.log"
             
@@ -9156,23 +9429,43 @@ class NuitkaPackager(QMainWindow):
                 f.write(f"Python路径: {current_python}\n")
                 f.write(f"日志文件: {self.current_log_file}\n")
                 f.write(f"{'='*50}\n\n")
-            
+
+            # 打开常驻追加句柄，写入全部交给后台线程：
+            # 主线程只做queue.put，磁盘卡顿不会阻塞GUI
+            self._log_fh = open(self.current_log_file, 'a', encoding='utf-8', buffering=1 << 16)
+            self._log_writer_q = queue.Queue()
+            self._log_writer_thread = threading.Thread(target=self._log_writer_loop, daemon=True)
+            self._log_writer_thread.start()
+
         except Exception as e:
             print(f"初始化日志失败: {str(e)}")
-    
+
+    def _log_writer_loop(self):
+        """后台日志写入线程：独占文件句柄，逐条取队列内容落盘
+
+        机械盘或杀毒软件扫描导致的磁盘停顿只拖慢本线程；
+        队列暂时取空时顺带flush一次，兼顾落盘及时性。
+        收到None哨兵后退出。
+        """
+        while True:
+            item = self._log_writer_q.get()
+            if item is None:
+                break
+            try:
+                self._log_fh.write(item)
+                if self._log_writer_q.empty():
+                    self._log_fh.flush()
+            except Exception as e:
+                print(f"写入日志文件失败: {str(e)}")
+
     def _write_to_log_file(self, message, tag=None):
-        """写入日志到文件"""
-        try:
-            if self.current_log_file and os.path.exists(self.current_log_file):
-                with open(self.current_log_file, 'a', encoding='utf-8') as f:
-                    # 获取包含毫秒的时间戳
-                    current_time = time.time()
-                    timestamp_ms = time.strftime("%Y%m%d %H:%M:%S", time.localtime(current_time)) + f":{int((current_time % 1) * 1000):03d}"
-                    tag_str = f"[{tag.upper()}] " if tag else ""
-                    f.write(f"{timestamp_ms} {tag_str}{message}")
-                    f.flush()  # 立即刷新到磁盘
-        except Exception as e:
-            print(f"写入日志文件失败: {str(e)}")
+        """写入日志到文件（格式化后入队，由后台写入线程落盘）"""
+        if self._log_writer_q is None:
+            return
+        # 获取包含毫秒的时间戳
+        timestamp_ms = self._fast_timestamp_ms()
+        tag_str = f"[{tag.upper()}] " if tag else ""
+        self._log_writer_q.put(f"{timestamp_ms} {tag_str}{message}")
     
     def _check_python_environment_change(self):
         """检查Python环境是否发生变化，如果变化则记录到界面日志
@@ -9202,12 +9495,25 @@ class NuitkaPackager(QMainWindow):
             print(f"检查Python环境变化失败: {str(e)}")
             return False
     
+    def _fast_timestamp_ms(self):
+        """生成包含毫秒的时间戳字符串（按整秒缓存strftime结果）
+
+        日志高峰期每秒可能有上千条消息，strftime/localtime每次都
+        分配新对象；秒数未变化时直接复用上次格式化的前缀，只重新
+        拼接毫秒部分。
+        """
+        current_time = _time()
+        int_sec = int(current_time)
+        if int_sec != self._ts_cached_sec:
+            self._ts_cached_sec = int_sec
+            self._ts_cached_str = _strftime("%Y%m%d %H:%M:%S", _localtime(int_sec))
+        return f"{self._ts_cached_str}:{int((current_time - int_sec) * 1000):03d}"
+
     def log_message(self, message, tag=None):
         """记录日志到界面"""
         # 获取包含毫秒的时间戳
-        current_time = time.time()
-        timestamp_ms = time.strftime("%Y%m%d %H:%M:%S", time.localtime(current_time)) + f":{int((current_time % 1) * 1000):03d}"
-        
+        timestamp_ms = self._fast_timestamp_ms()
+
         # 添加到日志缓冲区
         if self.continuous_logging:
             log_entry = {
@@ -9217,36 +9523,23 @@ class NuitkaPackager(QMainWindow):
                 'type': 'system'
             }
             self.log_buffer.append(log_entry)
-            
-            # 限制缓冲区大小
-            if len(self.log_buffer) > self.max_log_buffer_size:
-                self.log_buffer.pop(0)
-        
+
+        # 窗口隐藏/尚未显示时只积压文本，跳过QTextEdit排版开销；
+        # 日志缓冲区和日志文件仍然照常记录，不丢数据
+        if not self.log_text.isVisible():
+            self._pending_ui_log_chunks.append((f"[{timestamp_ms}] {message}", tag))
+            return
+        if self._pending_ui_log_chunks:
+            self._flush_pending_ui_logs()
+
         # 添加带颜色的文本到界面
+        # 行数上限由文档的maximumBlockCount原生淘汰，无需手动删除
         cursor = self.log_text.textCursor()
         cursor.movePosition(QTextCursor.End)
-        
-        # 日志行数控制 (最大500000行)
-        MAX_LOG_LINES = 500000
-        if self.log_text.document().blockCount() > MAX_LOG_LINES:
-            cursor.setPosition(0)
-            for _ in range(1000):  # 删除前1000行
-                cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
-            cursor.removeSelectedText()
-            cursor.movePosition(QTextCursor.End)
-        
-        # 设置文本颜色
-        if tag == "error":
-            text_color = QColor("#FF6B6B")  # 红色
-        elif tag == "success":
-            text_color = QColor("#36C5F0")  # 蓝色
-        elif tag == "warning":
-            text_color = QColor("#FFBA49")  # 橙色
-        elif tag == "info":
-            text_color = QColor("#34A853")  # 绿色
-        else:
-            text_color = QColor("#4C5270")  # 深蓝色
-        
+
+        # 设置文本颜色（预构造的QColor查表）
+        text_color = self._tag_colors.get(tag, self._default_log_color)
+
         self.log_text.setTextColor(text_color)
         
         # 在消息前添加时间戳
@@ -9259,14 +9552,62 @@ class NuitkaPackager(QMainWindow):
             self.log_text.setTextCursor(cursor)
             self.log_text.ensureCursorVisible()
     
+    def log_message_bulk(self, message, tag=None):
+        """批量记录多行日志到界面
+
+        将已拼接好的多行文本作为一个整体写入日志，
+        只触发一次光标插入和一次滚动，避免逐行调用
+        log_message时每行都引发QTextEdit重排版。
+
+        Args:
+            message (str): 已拼接好的多行日志文本
+            tag (str): 日志颜色标签，与log_message一致
+        """
+        self.log_message(message, tag)
+
+    def _flush_pending_ui_logs(self):
+        """把窗口不可见期间积压的界面日志一次性补插
+
+        相邻同标签的文本先拼接，按颜色分组插入，
+        积压再多也只触发少量光标操作和一次滚动。
+        """
+        chunks = self._pending_ui_log_chunks
+        self._pending_ui_log_chunks = []
+
+        cursor = self.log_text.textCursor()
+        cursor.movePosition(QTextCursor.End)
+
+        group_texts = []
+        group_tag = None
+        for text, tag in chunks:
+            if group_texts and tag != group_tag:
+                self.log_text.setTextColor(self._tag_colors.get(group_tag, self._default_log_color))
+                cursor.insertText(''.join(group_texts))
+                group_texts = []
+            group_texts.append(text)
+            group_tag = tag
+        if group_texts:
+            self.log_text.setTextColor(self._tag_colors.get(group_tag, self._default_log_color))
+            cursor.insertText(''.join(group_texts))
+
+        cursor.movePosition(QTextCursor.End)
+        if self.auto_scroll:
+            self.log_text.setTextCursor(cursor)
+            self.log_text.ensureCursorVisible()
+
+    def showEvent(self, event):
+        """窗口重新可见时补插积压的界面日志"""
+        super().showEvent(event)
+        if self._pending_ui_log_chunks:
+            self._flush_pending_ui_logs()
+
     def log_user_action(self, action, details=""):
         """记录用户操作"""
         if not self.user_action_logging:
             return
             
         # 获取包含毫秒的时间戳
-        current_time = time.time()
-        timestamp_ms = time.strftime("%Y%m%d %H:%M:%S", time.localtime(current_time)) + f":{int((current_time % 1) * 1000):03d}"
+        timestamp_ms = self._fast_timestamp_ms()
         
         action_entry = {
             'timestamp': timestamp_ms,
@@ -9275,11 +9616,7 @@ class NuitkaPackager(QMainWindow):
         }
         
         self.user_actions.append(action_entry)
-        
-        # 限制用户操作记录数量
-        if len(self.user_actions) > self.max_user_actions:
-            self.user_actions.pop(0)
-        
+
         # 在日志中显示用户操作
         action_message = f"👤 用户操作: {action}"
         if details:
@@ -9322,26 +9659,27 @@ class NuitkaPackager(QMainWindow):
             return ""
             
         # 获取包含毫秒的时间戳
-        current_time = time.time()
-        timestamp_ms = time.strftime("%Y%m%d %H:%M:%S", time.localtime(current_time)) + f":{int((current_time % 1) * 1000):03d}"
-        
-        log_content = "# 连续日志记录\n"
-        log_content += f"# 生成时间: {timestamp_ms}\n"
-        log_content += f"# 总日志条数: {len(self.log_buffer)}\n\n"
+        timestamp_ms = self._fast_timestamp_ms()
         
+        # 列表append后一次join，避免大缓冲区下+=拼接的O(N²)复制
+        parts = ["# 连续日志记录\n",
+                 f"# 生成时间: {timestamp_ms}\n",
+                 f"# 总日志条数: {len(self.log_buffer)}\n\n"]
+        parts_append = parts.append
+
         for entry in self.log_buffer:
             timestamp = entry['timestamp']
             message = entry['message'].rstrip()
             tag = entry.get('tag', '')
             log_type = entry.get('type', 'system')
-            
+
             if log_type == 'user_action':
-                log_content += f"{timestamp} [用户操作] {message}\n"
+                parts_append(f"{timestamp} [用户操作] {message}\n")
             else:
                 tag_str = f"[{tag.upper()}] " if tag else ""
-                log_content += f"{timestamp} {tag_str}{message}\n"
-        
-        return log_content
+                parts_append(f"{timestamp} {tag_str}{message}\n")
+
+        return "".join(parts)
     
     def get_user_actions_summary(self):
         """获取用户操作摘要"""
@@ -9349,24 +9687,25 @@ class NuitkaPackager(QMainWindow):
             return ""
             
         # 获取包含毫秒的时间戳
-        current_time = time.time()
-        timestamp_ms = time.strftime("%Y%m%d %H:%M:%S", time.localtime(current_time)) + f":{int((current_time % 1) * 1000):03d}"
-        
-        summary = "# 用户操作记录摘要\n"
-        summary += f"# 记录时间: {timestamp_ms}\n"
-        summary += f"# 总操作次数: {len(self.user_actions)}\n\n"
+        timestamp_ms = self._fast_timestamp_ms()
         
+        # 同get_continuous_log_content：列表append后一次join
+        parts = ["# 用户操作记录摘要\n",
+                 f"# 记录时间: {timestamp_ms}\n",
+                 f"# 总操作次数: {len(self.user_actions)}\n\n"]
+        parts_append = parts.append
+
         for action in self.user_actions:
             timestamp = action['timestamp']
             action_name = action['action']
             details = action.get('details', '')
-            
-            summary += f"{timestamp} - {action_name}"
+
             if details:
-                summary += f" : {details}"
-            summary += "\n"
-        
-        return summary
+                parts_append(f"{timestamp} - {action_name} : {details}\n")
+            else:
+                parts_append(f"{timestamp} - {action_name}\n")
+
+        return "".join(parts)
     
     # ================= 插件加载 =================
     
@@ -9424,11 +9763,32 @@ class NuitkaPackager(QMainWindow):
         }
         
         try:
+            # 紧凑格式序列化（中文不转义），内容与上次相同时跳过磁盘写入
+            config_json = json.dumps(config, ensure_ascii=False, separators=(',', ':'))
+            if config_json == self._last_config_json:
+                return
             with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+                f.write(config_json)
+            self._last_config_json = config_json
         except Exception as e:
             self.log_message(f"保存配置失败: {e}\n", "error")
     
+    @staticmethod
+    def _set_checked(widget, checked=True):
+        """控件非None时设置选中状态
+
+        create_widgets先于load_config执行，属性必然存在，
+        只需防None，免去逐处的hasattr样板。
+        """
+        if widget is not None:
+            widget.setChecked(checked)
+
+    @staticmethod
+    def _set_text(widget, text):
+        """控件非None时设置文本内容"""
+        if widget is not None:
+            widget.setText(text)
+
     def load_config(self):
         try:
             if os.path.exists(self.config_path):
@@ -9436,12 +9796,10 @@ class NuitkaPackager(QMainWindow):
                     config = json.load(f)
                     
                 self.mode_var = config.get("mode", "onefile")
-                if hasattr(self, 'onefile_rb') and self.onefile_rb is not None:
-                    if self.mode_var == "onefile":
-                        self.onefile_rb.setChecked(True)
-                    else:
-                        if hasattr(self, 'standalone_rb') and self.standalone_rb is not None:
-                            self.standalone_rb.setChecked(True)
+                if self.mode_var == "onefile":
+                    self._set_checked(self.onefile_rb)
+                else:
+                    self._set_checked(self.standalone_rb)
                 
                 self.platform_var = "windows"  # 固定为Windows平台
                 # 注意：windows_rb不存在，移除这行代码
@@ -9449,7 +9807,7 @@ class NuitkaPackager(QMainWindow):
                 QTimer.singleShot(0, lambda: self.update_platform("windows"))
                 
                 self.opt_var = config.get("optimize", 1)
-                if hasattr(self, 'opt_group') and self.opt_group is not None:
+                if self.opt_group is not None:
                     buttons = self.opt_group.buttons()
                     if len(buttons) >= 3:
                         if self.opt_var == 0:
@@ -9459,19 +9817,18 @@ class NuitkaPackager(QMainWindow):
                         else:
                             buttons[2].setChecked(True)
                 
-                self.jobs_var = config.get("jobs", min(4, os.cpu_count()))
-                if hasattr(self, 'jobs_slider') and self.jobs_slider is not None:
+                self.jobs_var = config.get("jobs", min(4, CPU_COUNT))
+                if self.jobs_slider is not None:
                     self.jobs_slider.setValue(self.jobs_var)
                 
                 self.compiler_var = config.get("compiler", "mingw")
-                if hasattr(self, 'msvc_rb') and self.msvc_rb is not None and hasattr(self, 'mingw_rb') and self.mingw_rb is not None:
-                    if self.compiler_var == "msvc":
-                        self.msvc_rb.setChecked(True)
-                    else:
-                        self.mingw_rb.setChecked(True)
+                if self.compiler_var == "msvc":
+                    self._set_checked(self.msvc_rb)
+                else:
+                    self._set_checked(self.mingw_rb)
                 
                 self.lto_var = config.get("use_lto", "yes")
-                if hasattr(self, 'lto_group') and self.lto_group is not None:
+                if self.lto_group is not None:
                     if self.lto_var == "off":
                         self.lto_group.button(0).setChecked(True)  # 第一个按钮是off
                     elif self.lto_var == "yes":
@@ -9480,51 +9837,50 @@ class NuitkaPackager(QMainWindow):
                         self.lto_group.button(2).setChecked(True)  # 第三个按钮是full
                 
                 self.upx_var = config.get("use_upx", False)
-                if hasattr(self, 'upx_cb') and self.upx_cb is not None:
-                    self.upx_cb.setChecked(self.upx_var)
+                self._set_checked(self.upx_cb, self.upx_var)
                 
                 self.upx_level = config.get("upx_level", "best")
-                if hasattr(self, 'upx_level_combo') and self.upx_level_combo is not None:
+                # upx_level_combo控件目前并未在create_widgets中创建，
+                # 用getattr防御，避免AttributeError中断后面的配置恢复
+                upx_level_combo = getattr(self, 'upx_level_combo', None)
+                if upx_level_combo is not None:
                     try:
-                        self.upx_level_combo.setCurrentIndex(["best", "normal", "fast"].index(self.upx_level))
+                        upx_level_combo.setCurrentIndex(["best", "normal", "fast"].index(self.upx_level))
                     except (ValueError, IndexError):
                         pass  # 如果upx_level值无效，忽略错误
                 
                 self.console_var = config.get("console", "disable")
-                if hasattr(self, 'console_enable_rb') and self.console_enable_rb is not None and hasattr(self, 'console_disable_rb') and self.console_disable_rb is not None:
-                    if self.console_var == "enable":
-                        self.console_enable_rb.setChecked(True)
-                    else:
-                        self.console_disable_rb.setChecked(True)
+                if self.console_var == "enable":
+                    self._set_checked(self.console_enable_rb)
+                else:
+                    self._set_checked(self.console_disable_rb)
                 
                 self.cleanup_cache = config.get("cleanup_cache", True)
-                if hasattr(self, 'cleanup_cb') and self.cleanup_cb is not None:
-                    self.cleanup_cb.setChecked(self.cleanup_cache)
+                self._set_checked(self.cleanup_cb, self.cleanup_cache)
                 
                 # 安全设置文本框内容
-                if hasattr(self, 'script_entry') and self.script_entry is not None:
-                    self.script_entry.setText(config.get("script", ""))
-                if hasattr(self, 'output_entry') and self.output_entry is not None:
-                    self.output_entry.setText(config.get("output_dir", ""))
-                if hasattr(self, 'name_entry') and self.name_entry is not None:
-                    self.name_entry.setText(config.get("exe_name", ""))
-                if hasattr(self, 'icon_entry') and self.icon_entry is not None:
-                    self.icon_entry.setText(config.get("icon", ""))
-                if hasattr(self, 'upx_path_entry') and self.upx_path_entry is not None:
-                    self.upx_path_entry.setText(config.get("upx_path", ""))
-                if hasattr(self, 'python_combo') and self.python_combo is not None:
+                self._set_text(self.script_entry, config.get("script", ""))
+                self._set_text(self.output_entry, config.get("output_dir", ""))
+                self._set_text(self.name_entry, config.get("exe_name", ""))
+                self._set_text(self.icon_entry, config.get("icon", ""))
+                self._set_text(self.upx_path_entry, config.get("upx_path", ""))
+                if self.python_combo is not None:
                     self.python_combo.setCurrentText(config.get("python_path", ""))
                 
-                # 安全设置插件列表
-                if hasattr(self, 'plugin_list') and self.plugin_list is not None:
-                    plugins = config.get("plugins", [])
-                    for i in range(self.plugin_list.count()):
-                        item = self.plugin_list.item(i)
-                        if item and item.text() in plugins:
-                            item.setSelected(True)
+                # 安全设置插件列表（单次扫描+set成员判断，更新期间屏蔽信号）
+                if self.plugin_list is not None:
+                    plugins = set(config.get("plugins", []))
+                    self.plugin_list.blockSignals(True)
+                    try:
+                        for i in range(self.plugin_list.count()):
+                            item = self.plugin_list.item(i)
+                            if item and item.text() in plugins:
+                                item.setSelected(True)
+                    finally:
+                        self.plugin_list.blockSignals(False)
                 
                 # 安全设置依赖列表
-                if hasattr(self, 'deps_list') and self.deps_list is not None:
+                if self.deps_list is not None:
                     self.deps_list.clear()
                     for dep in config.get("dependencies", []):
                         self.deps_list.addItem(dep)
@@ -9557,146 +9913,152 @@ class NuitkaPackager(QMainWindow):
                 self.log_message(f"  找到的环境数: {stats.get('found_count', 0)}\n", "info")
             self.log_message("========================\n", "info")
     
-    def uses_tkinter(self, script_path):
-        """检查脚本是否使用了tkinter模块"""
-        if not os.path.exists(script_path):
-            return False
-        
+    # ast.parse失败时字节级回退扫描用的合并正则：行首锚定的import/from
+    # 语句一次交替扫描就找出所有关心的模块，注释里出现的名字不会误报
+    _IMPORT_FALLBACK_RE = re.compile(
+        rb'^\s*(?:import|from)\s+'
+        rb'(tkinter|Tkinter|PySide6|PyQt6|Shiboken|PyQt5|sip|numpy|PIL|Image|Pillow)\b',
+        re.MULTILINE,
+    )
+
+    def _scan_imports_fallback(self, script_path):
+        """ast.parse失败时的回退：mmap映射后做单遍字节级导入扫描
+
+        语法错误或编码异常的脚本无法走AST路径，退化为C级正则扫描，
+        一次遍历收集所有命中的模块名。
+        """
         try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 检查常见的tkinter导入模式
-            tkinter_patterns = [
-                r'^\s*import\s+tkinter(?:\s|$)',
-                r'^\s*from\s+tkinter(?:\s+import\s+\w+(?:,\s*\w+)*)?',  # from tkinter import ttk, filedialog
-                r'^\s*import\s+Tkinter(?:\s|$)',
-                r'^\s*from\s+Tkinter(?:\s+import\s+\w+(?:,\s*\w+)*)?',  # from Tkinter import ttk, filedialog
-                r'^\s*import\s+\w+\s+as\s+tk\b',  # import tkinter as tk
-            ]
-            
-            # 将内容按行分割，逐行检查
-            lines = content.split('\n')
-            for line in lines:
-                # 跳过注释行
-                if line.strip().startswith('#'):
-                    continue
-                for pattern in tkinter_patterns:
-                    if re.search(pattern, line):
-                        return True
-            
-            return False
+            with open(script_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 廉价子串预判：连import字样都没有的文件直接判空，
+                    # C级fastsearch比启动正则引擎快得多
+                    if mm.find(b'import') == -1:
+                        return frozenset()
+                    return frozenset(
+                        m.group(1).decode('ascii')
+                        for m in self._IMPORT_FALLBACK_RE.finditer(mm)
+                    )
+        except (OSError, ValueError):
+            return frozenset()
+
+    def _imported_modules(self, script_path, quiet=False):
+        """解析脚本的顶层导入模块名集合（按 (路径, mtime, size) 缓存）
+
+        build_nuitka_command 会对同一脚本依次调用 uses_tkinter/uses_pyside6
+        等多个检查，此处用一次 ast.parse 解析出所有导入供各检查复用，
+        避免每次构建命令时重复读取和解析同一文件。
+
+        Args:
+            quiet (bool): 为True时不向界面写警告日志（后台预热线程使用）
+        """
+        try:
+            file_stat = os.stat(script_path)
+        except OSError:
+            return frozenset()
+
+        cache_key = (script_path, file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._script_imports_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 分块流式计算内容sha256：命中磁盘缓存时无需把整个文件读进内存，
+        # 大体积生成脚本的峰值内存从O(文件大小)降到O(块大小)
+        hasher = hashlib.sha256()
+        try:
+            with open(script_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    hasher.update(chunk)
+        except OSError:
+            return frozenset()
+
+        # 跨会话磁盘缓存按内容sha256命中：脚本未改动时直接跳过解析
+        content_sha = hasher.hexdigest()
+        disk_cache = self._load_imports_disk_cache()
+        cached_modules = disk_cache.get(content_sha)
+        if cached_modules is not None:
+            result = frozenset(cached_modules)
+            self._script_imports_cache[cache_key] = result
+            return result
+
+        # 缓存未命中才整读源码交给ast.parse
+        try:
+            with open(script_path, 'rb') as f:
+                source = f.read()
+        except OSError:
+            return frozenset()
+
+        try:
+            modules = set()
+            for node in ast.walk(ast.parse(source)):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        modules.add(alias.name.split('.')[0])
+                elif isinstance(node, ast.ImportFrom):
+                    if node.module:
+                        modules.add(node.module.split('.')[0])
+            result = frozenset(modules)
         except Exception as e:
-            self.log_message(f"⚠ 检查tkinter使用情况时出错: {str(e)}\n", "warning")
-            return False
-    
+            if not quiet:
+                self.log_message(f"⚠ 解析脚本导入时出错，改用字节扫描回退: {str(e)}\n", "warning")
+            result = self._scan_imports_fallback(script_path)
+
+        self._script_imports_cache[cache_key] = result
+        disk_cache[content_sha] = sorted(result)
+        self._save_imports_disk_cache(disk_cache)
+        return result
+
+    def _load_imports_disk_cache(self):
+        """加载跨会话的导入扫描结果缓存（懒加载，只读一次）"""
+        if self._script_imports_disk is None:
+            cache_file = os.path.join(self.cache_dir, "script_imports_cache.json")
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    self._script_imports_disk = json.load(f)
+            except (OSError, ValueError):
+                self._script_imports_disk = {}
+        return self._script_imports_disk
+
+    def _save_imports_disk_cache(self, disk_cache):
+        """落盘导入扫描结果缓存（内容寻址，条目很小，直接覆盖写）"""
+        cache_file = os.path.join(self.cache_dir, "script_imports_cache.json")
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as f:
+                json.dump(disk_cache, f, ensure_ascii=False, separators=(',', ':'))
+        except OSError:
+            pass  # 缓存写入失败不影响检测结果
+
+    # 各框架检测对应的模块名集合：类常量只构造一次，
+    # 免去每次检测重建临时set字面量
+    _TKINTER_MODULES = frozenset({'tkinter', 'Tkinter'})
+    _QT6_MODULES = frozenset({'PySide6', 'PyQt6', 'Shiboken'})
+    _QT5_MODULES = frozenset({'PyQt5', 'sip'})
+    _PIL_MODULES = frozenset({'PIL', 'Image', 'Pillow'})
+
+    def uses_tkinter(self, script_path):
+        """检查脚本是否使用了tkinter模块"""
+        modules = self._imported_modules(script_path)
+        return not modules.isdisjoint(self._TKINTER_MODULES)
+
     def uses_pyside6(self, script_path):
         """检查脚本是否使用了PySide6模块"""
-        if not os.path.exists(script_path):
-            return False
-        
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 检查常见的PySide6导入模式
-            pyside6_patterns = [
-                r'import\s+PySide6',
-                r'from\s+PySide6',
-                r'import\s+PyQt6',
-                r'from\s+PyQt6',
-                r'import\s+Shiboken',
-                r'from\s+Shiboken'
-            ]
-            
-            for pattern in pyside6_patterns:
-                if re.search(pattern, content):
-                    return True
-            
-            return False
-        except Exception as e:
-            self.log_message(f"⚠ 检查PySide6使用情况时出错: {str(e)}\n", "warning")
-            return False
-    
+        modules = self._imported_modules(script_path)
+        return not modules.isdisjoint(self._QT6_MODULES)
+
     def uses_pyqt5(self, script_path):
         """检查脚本是否使用了PyQt5模块"""
-        if not os.path.exists(script_path):
-            return False
-        
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 检查常见的PyQt5导入模式
-            pyqt5_patterns = [
-                r'import\s+PyQt5',
-                r'from\s+PyQt5',
-                r'import\s+sip',
-                r'from\s+sip'
-            ]
-            
-            for pattern in pyqt5_patterns:
-                if re.search(pattern, content):
-                    return True
-            
-            return False
-        except Exception as e:
-            self.log_message(f"⚠ 检查PyQt5使用情况时出错: {str(e)}\n", "warning")
-            return False
-    
+        modules = self._imported_modules(script_path)
+        return not modules.isdisjoint(self._QT5_MODULES)
+
     def uses_pil(self, script_path):
         """检查脚本是否使用了PIL/Pillow模块"""
-        if not os.path.exists(script_path):
-            return False
-        
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 检查常见的PIL导入模式
-            pil_patterns = [
-                r'import\s+PIL',
-                r'from\s+PIL',
-                r'import\s+Image',
-                r'from\s+Image',
-                r'import\s+Pillow',
-                r'from\s+Pillow'
-            ]
-            
-            for pattern in pil_patterns:
-                if re.search(pattern, content):
-                    return True
-            
-            return False
-        except Exception as e:
-            self.log_message(f"⚠ 检查PIL使用情况时出错: {str(e)}\n", "warning")
-            return False
-    
+        modules = self._imported_modules(script_path)
+        return not modules.isdisjoint(self._PIL_MODULES)
+
     def uses_numpy(self, script_path):
         """检查脚本是否使用了numpy模块"""
-        if not os.path.exists(script_path):
-            return False
-        
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # 检查常见的numpy导入模式
-            numpy_patterns = [
-                r'import\s+numpy',
-                r'from\s+numpy',
-                r'import\s+np\s*$',
-                r'from\s+np'
-            ]
-            
-            for pattern in numpy_patterns:
-                if re.search(pattern, content):
-                    return True
-            
-            return False
-        except Exception as e:
-            self.log_message(f"⚠ 检查numpy使用情况时出错: {str(e)}\n", "warning")
-            return False
+        modules = self._imported_modules(script_path)
+        return 'numpy' in modules
     
     def on_script_path_changed(self):
         """脚本路径变化时的处理函数
@@ -9713,6 +10075,16 @@ class NuitkaPackager(QMainWindow):
         # 记录同步信息（可选，用于调试）
         if script_path:
             self.log_message(f"🔄 已同步运行Python文件路径: {script_path}\n", "info")
+
+        # 后台预热导入扫描缓存：等用户点击打包时各uses_*检测已是缓存命中，
+        # 大脚本的解析不会卡在界面线程上
+        if script_path.endswith('.py') and os.path.isfile(script_path):
+            threading.Thread(
+                target=self._imported_modules,
+                args=(script_path,),
+                kwargs={'quiet': True},
+                daemon=True,
+            ).start()
     
     def run_python_file(self):
         """运行脚本路径中的Python文件"""
@@ -9737,65 +10109,93 @@ class NuitkaPackager(QMainWindow):
         self.log_message(f"🚀 开始运行Python文件: {file_path}\n", "info")
         self.log_message(f"🔧 使用Python解释器: {python_cmd}\n", "info")
         
-        # 检查是否为conda环境
+        # 子进程读取循环放到后台线程，输出经message_queue回流界面，
+        # 运行期间Qt事件循环保持响应
+        threading.Thread(
+            target=self._run_python_file_worker,
+            args=(python_cmd, file_path),
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _conda_subprocess_env(python_cmd):
+        """构造直接调用conda环境解释器所需的环境变量
+
+        省掉 shell=True + conda activate 的额外shell进程和conda初始化
+        钩子开销：把环境的可执行目录前置到PATH并设置CONDA_PREFIX，
+        即可满足环境内解释器和DLL的查找需求。
+        """
+        env_prefix = os.path.dirname(python_cmd)
+        if os.path.basename(env_prefix).lower() in ('bin', 'scripts'):
+            env_prefix = os.path.dirname(env_prefix)
+        env = os.environ.copy()
+        env['CONDA_PREFIX'] = env_prefix
+        env['CONDA_DEFAULT_ENV'] = os.path.basename(env_prefix)
+        env_paths = [
+            env_prefix,
+            os.path.join(env_prefix, 'Scripts'),
+            os.path.join(env_prefix, 'Library', 'bin'),
+            os.path.join(env_prefix, 'bin'),
+        ]
+        env['PATH'] = os.pathsep.join(env_paths + [env.get('PATH', '')])
+        return env
+
+    def _run_python_file_worker(self, python_cmd, file_path):
+        """后台线程中运行Python文件并把输出送回消息队列"""
+        put = self.message_queue.put
         conda_env_name = self._get_conda_env_name(python_cmd)
-        
+
         try:
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
-            
+            creationflags = NO_WINDOW_FLAGS
+
+            # conda环境直接调用环境内解释器并注入环境变量，
+            # 不再经由 shell + conda activate 间接启动
+            cmd = [python_cmd, file_path]
+            popen_env = None
             if conda_env_name:
-                # 如果是conda环境，先激活环境再运行
-                activate_cmd = f'conda activate {conda_env_name} && '
-                full_cmd = activate_cmd + f'python "{file_path}"'
-                self.log_message(f"📋 执行命令: {full_cmd}\n", "info")
-                
-                # 使用subprocess执行命令
-                proc = subprocess.Popen(
-                    full_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    shell=True
-                )
+                popen_env = self._conda_subprocess_env(python_cmd)
+                put(("log", f"📋 执行命令: {' '.join(cmd)} (conda环境: {conda_env_name})\n", "info"))
             else:
-                # 直接运行Python文件
-                cmd = [python_cmd, file_path]
-                self.log_message(f"📋 执行命令: {' '.join(cmd)}\n", "info")
-                
-                # 使用subprocess执行命令
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    shell=False
-                )
-            
-            # 读取并输出运行结果
+                put(("log", f"📋 执行命令: {' '.join(cmd)}\n", "info"))
+
+            # 使用subprocess执行命令
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                universal_newlines=True,
+                creationflags=creationflags,
+                shell=False,
+                env=popen_env
+            )
+
+            # 读取并输出运行结果（与run_nuitka相同的攒批策略：
+            # 满32行或超过50ms才put一次，减少队列锁竞争和界面刷新）
+            pending_lines = []
+            last_flush = time.monotonic()
             for line in proc.stdout:
-                self.log_message(f"📤 {line.strip()}\n", "output")
-            
+                pending_lines.append(f"📤 {line.strip()}\n")
+                now = time.monotonic()
+                if len(pending_lines) >= 32 or now - last_flush > 0.05:
+                    put(("log_batch", ''.join(pending_lines), "output"))
+                    pending_lines = []
+                    last_flush = now
+            if pending_lines:
+                put(("log_batch", ''.join(pending_lines), "output"))
+
             # 等待进程结束
             return_code = proc.wait()
-            
+
             if return_code == 0:
-                self.log_message("✅ Python文件运行完成\n", "success")
+                put(("log", "✅ Python文件运行完成\n", "success"))
             else:
-                self.log_message(f"⚠ Python文件运行结束，返回码: {return_code}\n", "warning")
-                
+                put(("log", f"⚠ Python文件运行结束，返回码: {return_code}\n", "warning"))
+
         except Exception as e:
-            self.log_message(f"❌ 运行Python文件时出错: {str(e)}\n", "error")
-    
+            put(("log", f"❌ 运行Python文件时出错: {str(e)}\n", "error"))
+
     def run_pkg_management(self):
         """执行包管理命令（安装/卸载）"""
         package_name = self.pkg_cmd_entry.text().strip()
@@ -9815,95 +10215,75 @@ class NuitkaPackager(QMainWindow):
         self.log_message(f"🔧 使用包管理器: {pkg_manager}\n", "info")
         self.log_message(f"🐍 使用Python解释器: {python_cmd}\n", "info")
         
-        # 检查是否为conda环境
+        # 同run_python_file：命令执行移到后台线程，避免阻塞界面
+        threading.Thread(
+            target=self._run_pkg_management_worker,
+            args=(python_cmd, pkg_manager, action, action_text, package_name),
+            daemon=True,
+        ).start()
+
+    def _run_pkg_management_worker(self, python_cmd, pkg_manager, action, action_text, package_name):
+        """后台线程中执行包管理命令并把输出送回消息队列"""
+        put = self.message_queue.put
         conda_env_name = self._get_conda_env_name(python_cmd)
-        
+
         try:
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = 0
-            
-            if conda_env_name:
-                # 如果是conda环境，先激活环境再执行命令
-                activate_cmd = f'conda activate {conda_env_name} && '
-                
-                if pkg_manager == "conda":
-                    if action == "install":
-                        full_cmd = activate_cmd + f'conda install {package_name} -y'
-                    else:  # uninstall
-                        full_cmd = activate_cmd + f'conda remove {package_name} -y'
-                elif pkg_manager == "mamba":
-                    if action == "install":
-                        full_cmd = activate_cmd + f'mamba install {package_name} -y'
-                    else:  # uninstall
-                        full_cmd = activate_cmd + f'mamba remove {package_name} -y'
-                else:  # pip
-                    if action == "install":
-                        full_cmd = activate_cmd + f'pip install {package_name}'
-                    else:  # uninstall
-                        full_cmd = activate_cmd + f'pip uninstall {package_name} -y'
-                
-                self.log_message(f"📋 执行命令: {full_cmd}\n", "info")
-                
-                # 使用subprocess执行命令
-                proc = subprocess.Popen(
-                    full_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    shell=True
-                )
-            else:
-                # 直接执行包管理命令
-                if pkg_manager == "conda":
-                    if action == "install":
-                        cmd = ["conda", "install", package_name, "-y"]
-                    else:  # uninstall
-                        cmd = ["conda", "remove", package_name, "-y"]
-                elif pkg_manager == "mamba":
-                    if action == "install":
-                        cmd = ["mamba", "install", package_name, "-y"]
-                    else:  # uninstall
-                        cmd = ["mamba", "remove", package_name, "-y"]
-                else:  # pip
-                    if action == "install":
-                        cmd = [python_cmd, "-m", "pip", "install", package_name]
-                    else:  # uninstall
-                        cmd = [python_cmd, "-m", "pip", "uninstall", package_name, "-y"]
-                
-                self.log_message(f"📋 执行命令: {' '.join(cmd)}\n", "info")
-                
-                # 使用subprocess执行命令
-                proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    startupinfo=startupinfo,
-                    shell=False
-                )
-            
-            # 读取并输出执行结果
+            creationflags = NO_WINDOW_FLAGS
+
+            # 统一构造参数列表直接执行：conda/mamba用-n指定目标环境，
+            # pip经目标解释器的 -m pip 调用，均不再激活shell
+            popen_env = None
+            if pkg_manager in ("conda", "mamba"):
+                verb = "install" if action == "install" else "remove"
+                cmd = [pkg_manager, verb, package_name, "-y"]
+                if conda_env_name:
+                    cmd[2:2] = ["-n", conda_env_name]
+            else:  # pip
+                if action == "install":
+                    cmd = [python_cmd, "-m", "pip", "install", package_name]
+                else:  # uninstall
+                    cmd = [python_cmd, "-m", "pip", "uninstall", package_name, "-y"]
+                if conda_env_name:
+                    popen_env = self._conda_subprocess_env(python_cmd)
+
+            put(("log", f"📋 执行命令: {' '.join(cmd)}\n", "info"))
+
+            # 使用subprocess执行命令
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                universal_newlines=True,
+                creationflags=creationflags,
+                shell=False,
+                env=popen_env
+            )
+
+            # 读取并输出执行结果（满32行或超过50ms攒批put一次）
+            pending_lines = []
+            last_flush = time.monotonic()
             for line in proc.stdout:
-                self.log_message(f"📦 {line.strip()}\n", "output")
-            
+                pending_lines.append(f"📦 {line.strip()}\n")
+                now = time.monotonic()
+                if len(pending_lines) >= 32 or now - last_flush > 0.05:
+                    put(("log_batch", ''.join(pending_lines), "output"))
+                    pending_lines = []
+                    last_flush = now
+            if pending_lines:
+                put(("log_batch", ''.join(pending_lines), "output"))
+
             # 等待进程结束
             return_code = proc.wait()
-            
+
             if return_code == 0:
-                self.log_message(f"✅ 包 {package_name} {action_text}完成\n", "success")
+                put(("log", f"✅ 包 {package_name} {action_text}完成\n", "success"))
             else:
-                self.log_message(f"⚠ 包{action_text}结束，返回码: {return_code}\n", "warning")
-                
+                put(("log", f"⚠ 包{action_text}结束，返回码: {return_code}\n", "warning"))
+
         except Exception as e:
-            self.log_message(f"❌ {action_text}包时出错: {str(e)}\n", "error")
+            put(("log", f"❌ {action_text}包时出错: {str(e)}\n", "error"))
     
     def on_python_combo_changed(self, text):
         """当Python解释器选择改变时，输出Nuitka和Python版本信息"""
@@ -9959,24 +10339,27 @@ class NuitkaPackager(QMainWindow):
                 self.log_message("🧹 正在清理后台线程...\n", "info")
                 self.thread_manager.cancel_all_threads()
                 
-                # 等待线程清理完成
-                import time
-                timeout = 3  # 3秒超时
-                start_time = time.time()
-                
-                while self.thread_manager.get_active_thread_count() > 0:
-                    if time.time() - start_time > timeout:
-                        self.log_message("⚠ 部分线程未能在超时时间内完成，强制关闭\n", "warning")
-                        break
-                    QApplication.processEvents()  # 保持UI响应
-                    time.sleep(0.1)
-                
-                self.log_message("✅ 线程清理完成\n", "success")
-            
+                # 事件驱动等待线程清理完成：每个线程一次内核级wait，
+                # 代替每100毫秒轮询活跃数+processEvents的自旋
+                if self.thread_manager.wait_for_all(3000):
+                    self.log_message("✅ 线程清理完成\n", "success")
+                else:
+                    self.log_message("⚠ 部分线程未能在超时时间内完成，强制关闭\n", "warning")
+            
+            # 通知后台日志写入线程退出并短暂等待，再关闭句柄刷盘
+            if getattr(self, '_log_writer_q', None) is not None:
+                self._log_writer_q.put(None)
+                if self._log_writer_thread is not None:
+                    self._log_writer_thread.join(timeout=2)
+                self._log_writer_q = None
+            if getattr(self, '_log_fh', None) is not None:
+                self._log_fh.close()
+                self._log_fh = None
+
             # 保存配置
             if hasattr(self, 'config_path'):
                 self.save_config()
-                
+
         except Exception as e:
             print(f"窗口关闭时清理资源出错: {str(e)}")
         
@@ -9984,9 +10367,56 @@ class NuitkaPackager(QMainWindow):
         super().closeEvent(event)
 
 
+def run_headless_packaging(args):
+    """命令行打包入口（无Qt依赖）
+
+    --script 模式下不再构建QApplication和整棵控件树——省去数百毫秒的
+    界面初始化，也不需要显示环境，可直接在CI里运行。按命令行参数
+    拼装Nuitka命令并把输出流式回显到标准输出。
+
+    Args:
+        args (argparse.Namespace): 解析后的命令行参数
+
+    Returns:
+        int: Nuitka子进程的返回码
+    """
+    script_path = os.path.abspath(args.script)
+    if not os.path.isfile(script_path):
+        print(f"❌ 脚本文件不存在: {script_path}")
+        return 1
+
+    output_dir = os.path.abspath(args.output_dir) if args.output_dir else os.path.dirname(script_path)
+
+    # 打包成exe后sys.executable是GUI自身，用统一的回退逻辑取真正的解释器
+    cmd = [get_fallback_python(), "-m", "nuitka"]
+    cmd.append("--onefile" if args.onefile else "--standalone")
+    if args.console == "enable":
+        cmd.append("--windows-console-mode=force")
+    else:
+        cmd.append("--windows-console-mode=disable")
+    if args.name:
+        cmd.append(f"--output-filename={args.name}")
+    if args.icon:
+        cmd.append(f"--windows-icon-from-ico={os.path.abspath(args.icon)}")
+    cmd.append(f"--output-dir={output_dir}")
+    cmd.append(script_path)
+
+    print(f"📋 执行命令: {' '.join(cmd)}")
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors='replace'
+    )
+    for line in proc.stdout:
+        print(line, end='')
+    return proc.wait()
+
+
 if __name__ == "__main__":
     import argparse
-    
+
     # 创建命令行参数解析器
     parser = argparse.ArgumentParser(description="Nuitka EXE 打包工具")
     parser.add_argument("--script", help="要打包的Python脚本路径", required=False)
@@ -9999,45 +10429,9 @@ if __name__ == "__main__":
     # 解析命令行参数
     args = parser.parse_args()
     
-    # 如果提供了脚本参数，则执行打包操作
+    # 如果提供了脚本参数，走无头打包路径，完全跳过Qt初始化
     if args.script:
-        # 创建应用实例
-        app = QApplication.instance()
-        if app is None:
-            app = QApplication(sys.argv)
-        
-        # 创建打包器实例
-        packager = NuitkaPackager()
-        
-        # 设置参数
-        if hasattr(packager, 'script_entry'):
-            packager.script_entry.setText(args.script)
-        if args.output_dir and hasattr(packager, 'output_entry'):
-            packager.output_entry.setText(args.output_dir)
-        if args.name and hasattr(packager, 'name_entry'):
-            packager.name_entry.setText(args.name)
-        if args.icon and hasattr(packager, 'icon_entry'):
-            packager.icon_entry.setText(args.icon)
-        
-        # 设置控制台选项
-        if hasattr(packager, 'console_enable_rb') and hasattr(packager, 'console_disable_rb'):
-            if args.console == "enable":
-                packager.console_enable_rb.setChecked(True)
-            else:
-                packager.console_disable_rb.setChecked(True)
-        
-        # 设置打包模式
-        if hasattr(packager, 'onefile_rb') and hasattr(packager, 'standalone_rb'):
-            if args.onefile:
-                packager.onefile_rb.setChecked(True)
-            else:
-                packager.standalone_rb.setChecked(True)
-        
-        # 执行打包
-        packager.start_packaging()
-        
-        # 退出应用
-        sys.exit(0)
+        sys.exit(run_headless_packaging(args))
     else:
         # 没有提供脚本参数，启动GUI界面
         app = QApplication(sys.argv)